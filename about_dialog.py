@@ -3,42 +3,141 @@ about_dialog.py — About dialog for Speech Bubble Editor.
 """
 
 import os
+import sys
+from typing import Optional
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QDialog, QVBoxLayout, QLabel, QPushButton,
 )
-from PyQt6.QtGui import QPixmap, QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QGuiApplication, QImage, QPixmap, QFont
+from PyQt6.QtCore import Qt, QDir, QThreadPool
 
 from version import __version__, __app_name__, __org_name__, __copyright__
 
 
+_BASE_DIR = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.abspath(__file__))
+
+
 def _resource_path(relative: str) -> str:
-    import sys
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, relative)
-    return os.path.join(os.path.dirname(os.path.abspath(__file__)), relative)
+    return os.path.join(_BASE_DIR, relative)
+
+
+# Dialog text only depends on import-time constants from version.py, so the
+# version, org, links and license blocks are rendered by one rich-text label
+# whose HTML is built once here.
+_TITLE_TEXT = f"About {__app_name__}"
+_INFO_HTML = (
+    "<div align='center'>"
+    f"<span style='font-size: 11pt; color: #888;'>Version {__version__}</span>"
+    "<br><br>"
+    f"<span style='font-size: 11px; color: #aaa;'>{__org_name__}<br>{__copyright__}</span>"
+    "<hr>"
+    "<span style='font-size: 11px;'>"
+    '<a href="https://longweekendlabs.github.io/speech-bubble-editor/">'
+    "longweekendlabs.github.io/speech-bubble-editor</a><br>"
+    '<a href="https://github.com/longweekendlabs/speech-bubble-editor">'
+    "github.com/longweekendlabs/speech-bubble-editor</a>"
+    "</span><br><br>"
+    "<span style='font-size: 10px; color: #999;'>"
+    "Official release builds: Windows x64, Linux x64,<br>"
+    "macOS Intel, and macOS Apple Silicon.<br><br>"
+    "Built with: Python · PyQt6 · OpenCV · FFmpeg · Pillow<br>"
+    f"{__copyright__}"
+    "</span>"
+    "</div>"
+)
+
+# QFont needs a QGuiApplication, so the shared font is created on first use.
+_NAME_FONT: Optional[QFont] = None
+
+
+def _name_font() -> QFont:
+    """Return the app-name label font shared by every dialog."""
+    global _NAME_FONT
+    if _NAME_FONT is None:
+        _NAME_FONT = QFont()
+        _NAME_FONT.setPointSize(18)
+        _NAME_FONT.setBold(True)
+    return _NAME_FONT
+
+
+# The logo ships pre-scaled to the 200 px width the dialog shows it at (see
+# create_icon.py), so loading it is a small PNG decode with no resampling.
+# The bundled icons folder is registered as a Qt search path once at import;
+# after that Qt resolves "icons:" itself and a missing file is just a null
+# pixmap, so repeat opens do no Python-side path work at all.
+QDir.addSearchPath("icons", _resource_path("icons"))
+_LOGO_IMAGE: Optional[QImage] = None
+_LOGO_PIXMAP: Optional[QPixmap] = None
+
+
+def _logo_candidates() -> tuple[tuple[str, float], ...]:
+    """Return (path, devicePixelRatio) pairs to try, best match first."""
+    screen = QGuiApplication.primaryScreen()
+    if screen is not None and screen.devicePixelRatio() > 1.0:
+        return (("icons:LongWeekendLabs.logo.200@2x.png", 2.0),
+                ("icons:LongWeekendLabs.logo.200.png", 1.0))
+    return (("icons:LongWeekendLabs.logo.200.png", 1.0),)
+
+
+def _decode_logo(candidates: tuple[tuple[str, float], ...]) -> None:
+    """Decode the logo into a QImage — safe to run off the GUI thread."""
+    global _LOGO_IMAGE
+    for path, dpr in candidates:
+        img = QImage(path)
+        if not img.isNull():
+            img.setDevicePixelRatio(dpr)
+            _LOGO_IMAGE = img
+            return
+
+
+def preload_logo() -> None:
+    """Decode the logo on a worker thread so the first About open never waits on disk."""
+    candidates = _logo_candidates()
+    QThreadPool.globalInstance().start(lambda: _decode_logo(candidates))
+
+
+def _logo_pixmap() -> Optional[QPixmap]:
+    """Return the 200 px logo, picking the @2x asset on high-DPI screens."""
+    global _LOGO_PIXMAP
+    if _LOGO_PIXMAP is None:
+        if _LOGO_IMAGE is None:
+            # Preload not started or still running — decode here instead.
+            _decode_logo(_logo_candidates())
+        if _LOGO_IMAGE is not None:
+            _LOGO_PIXMAP = QPixmap.fromImage(_LOGO_IMAGE)
+    return _LOGO_PIXMAP
 
 
 class AboutDialog(QDialog):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(f"About {__app_name__}")
+        self.setWindowTitle(_TITLE_TEXT)
         self.setFixedWidth(440)
         self.setModal(True)
-        self._build()
+        self._built = False
+
+    def setVisible(self, visible: bool):
+        # Widgets are only created the first time the dialog is actually shown.
+        # This runs before QDialog.setVisible centres the dialog on its
+        # parent, so the placement uses the final size (showEvent is too late).
+        if visible and not self._built:
+            self._build()
+            self._built = True
+            self.adjustSize()
+        super().setVisible(visible)
 
     def _build(self):
+        # Hold repaints until every widget is in so the layout settles once.
+        self.setUpdatesEnabled(False)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 20)
         layout.setSpacing(12)
 
         # ── Logo ─────────────────────────────────────────────────────────
-        logo_path = _resource_path(os.path.join("icons", "LongWeekendLabs.logo.jpg"))
-        if os.path.exists(logo_path):
-            logo_pm = QPixmap(logo_path).scaledToWidth(
-                200, Qt.TransformationMode.SmoothTransformation)
+        logo_pm = _logo_pixmap()
+        if logo_pm is not None:
             logo_label = QLabel()
             logo_label.setPixmap(logo_pm)
             logo_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
@@ -46,66 +145,21 @@ class AboutDialog(QDialog):
 
         # ── App name ─────────────────────────────────────────────────────
         name_label = QLabel(__app_name__)
-        f = QFont()
-        f.setPointSize(18)
-        f.setBold(True)
-        name_label.setFont(f)
+        name_label.setFont(_name_font())
         name_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         layout.addWidget(name_label)
 
-        # ── Version ──────────────────────────────────────────────────────
-        ver_label = QLabel(f"Version {__version__}")
-        f2 = QFont()
-        f2.setPointSize(11)
-        ver_label.setFont(f2)
-        ver_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        ver_label.setStyleSheet("color: #888;")
-        layout.addWidget(ver_label)
-
-        # ── Org / copyright ──────────────────────────────────────────────
-        org_label = QLabel(f"{__org_name__}\n{__copyright__}")
-        org_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        org_label.setStyleSheet("color: #aaa; font-size: 11px;")
-        layout.addWidget(org_label)
-
-        # ── Divider ──────────────────────────────────────────────────────
-        from PyQt6.QtWidgets import QFrame
-        line = QFrame()
-        line.setFrameShape(QFrame.Shape.HLine)
-        line.setFrameShadow(QFrame.Shadow.Sunken)
-        layout.addWidget(line)
-
-        # ── Project links ────────────────────────────────────────────────
-        links_label = QLabel(
-            '<a href="https://longweekendlabs.github.io/speech-bubble-editor/">'
-            'longweekendlabs.github.io/speech-bubble-editor</a><br>'
-            '<a href="https://github.com/longweekendlabs/speech-bubble-editor">'
-            'github.com/longweekendlabs/speech-bubble-editor</a>'
-        )
-        links_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        links_label.setOpenExternalLinks(True)
-        links_label.setStyleSheet("font-size: 11px;")
-        layout.addWidget(links_label)
-
-        # ── License ──────────────────────────────────────────────────────
-        license_text = (
-            "Official release builds: Windows x64, Linux x64,\n"
-            "macOS Intel, and macOS Apple Silicon.\n\n"
-            "Built with: Python · PyQt6 · OpenCV · FFmpeg · Pillow\n"
-            f"{__copyright__}"
-        )
-        lic_label = QLabel(license_text)
-        lic_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        lic_label.setStyleSheet("color: #999; font-size: 10px;")
-        lic_label.setWordWrap(True)
-        layout.addWidget(lic_label)
+        # ── Version / org / links / license ──────────────────────────────
+        info_label = QLabel(_INFO_HTML)
+        info_label.setTextFormat(Qt.TextFormat.RichText)
+        info_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+        info_label.setOpenExternalLinks(True)
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
 
         # ── Close button ─────────────────────────────────────────────────
         close_btn = QPushButton("Close")
         close_btn.setFixedWidth(100)
         close_btn.clicked.connect(self.accept)
-        h = QHBoxLayout()
-        h.addStretch()
-        h.addWidget(close_btn)
-        h.addStretch()
-        layout.addLayout(h)
+        layout.addWidget(close_btn, alignment=Qt.AlignmentFlag.AlignHCenter)
+        self.setUpdatesEnabled(True)
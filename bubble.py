@@ -7,6 +7,7 @@ traces the outer edge seamlessly — no seam, no black line cutting the tail.
 Styles:  "oval" | "cloud" | "rect" | "spiky" | "text" | "scrim" | "caption"
 """
 
+import functools
 import math
 from PyQt6.QtWidgets import (
     QGraphicsItem, QGraphicsEllipseItem, QGraphicsTextItem,
@@ -15,9 +16,17 @@ from PyQt6.QtWidgets import (
     QWidget
 )
 from PyQt6.QtGui import (
-    QPainter, QPainterPath, QColor, QPen, QBrush, QFont, QCursor
+    QPainter, QPainterPath, QColor, QPen, QBrush, QFont, QCursor,
+    QTextLayout, QTextOption, QPixmap, QPixmapCache, QPolygonF, QTransform,
+    QAction,
+)
+from PyQt6.QtCore import Qt, QRectF, QPointF, QElapsedTimer, QTimer
+from PyQt6 import sip
+
+from undo_commands import (
+    AddBubbleCommand, DeleteBubbleCommand, MoveBubbleCommand,
+    ResizeBubbleCommand, TextChangeCommand,
 )
-from PyQt6.QtCore import Qt, QRectF, QPointF
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -28,7 +37,109 @@ TAIL_DOT_R    = 9
 DEFAULT_W     = 220
 DEFAULT_H     = 130
 DEFAULT_STYLE = "oval"
+STYLES        = ("oval", "cloud", "rect", "spiky", "text", "scrim", "caption")
+_TAIL_STYLES  = frozenset(("oval", "cloud", "spiky"))   # styles with a draggable tail
+# Context-menu labels, in menu order
+_STYLE_MENU = (
+    ("oval",    "Oval  — speech bubble"),
+    ("cloud",   "Cloud — thought bubble"),
+    ("rect",    "Rectangle — caption bar"),
+    ("spiky",   "Spiky — shout / explosion"),
+    ("text",    "Text only — no bubble"),
+    ("scrim",   "Scrim — dark text strip"),
+    ("caption", "Caption — stroke text overlay"),
+)
+DRAG_FRAME_MS = 16        # min interval between drag repaints (~60 Hz)
+_LEFT = Qt.MouseButton.LeftButton
+_PIXMAP_CACHE_MAX_PX = 2048 * 1024   # larger rect/scrim fills (> 8 MB) are drawn directly
 ANCHORS = ["TL", "TC", "TR", "ML", "MR", "BL", "BC", "BR"]
+# Handle placement as fractions of the body rect: (anchor, fx, fy)
+_ANCHOR_OFFSETS = (
+    ("TL", 0.0, 0.0), ("TC", 0.5, 0.0), ("TR", 1.0, 0.0),
+    ("ML", 0.0, 0.5),                   ("MR", 1.0, 0.5),
+    ("BL", 0.0, 1.0), ("BC", 0.5, 1.0), ("BR", 1.0, 1.0),
+)
+
+# Thought-cloud bumps: (fraction-x, fraction-y, radius-fraction-of-min-dimension)
+_CLOUD_BUMPS = (
+    (0.14, 0.62, 0.22),
+    (0.28, 0.42, 0.28),
+    (0.48, 0.34, 0.31),
+    (0.68, 0.42, 0.28),
+    (0.84, 0.62, 0.22),
+    (0.80, 0.78, 0.23),
+    (0.62, 0.84, 0.26),
+    (0.38, 0.84, 0.26),
+    (0.18, 0.78, 0.21),
+)
+
+# Starburst vertices on the unit circle, alternating spike tip / valley,
+# starting at 12 o'clock.  Tips vary in reach for an organic, energetic look;
+# valleys sit at 64 %.  Scaled by the body half-size at build time.
+_SPIKES = 18
+_SPIKY_ANGLES = tuple(math.pi * i / _SPIKES - math.pi / 2 for i in range(_SPIKES * 2))
+_SPIKY_REACH = tuple(1.0 + 0.22 * math.sin(i * 1.9 + 0.8) if i % 2 == 0 else 0.64
+                     for i in range(_SPIKES * 2))
+# As a polygon, so one QTransform.map() places every vertex in C++.
+_SPIKY_POLY = QPolygonF([QPointF(math.cos(a) * v, math.sin(a) * v)
+                         for a, v in zip(_SPIKY_ANGLES, _SPIKY_REACH)])
+_SPIKY_ELEMENTS = _SPIKES * 2 + 1   # path elements: 36 vertices + closing lineTo
+
+# Thought-bubble dots: (fraction-of-available-length, base-radius,
+# minimum available tail length before the dot appears)
+_THOUGHT_DOTS = (
+    (0.12, 11,   0),
+    (0.38,  8,   0),
+    (0.60,  6,   0),
+    (0.75,  4,  80),
+    (0.87,  3, 140),
+)
+
+# Default bubble font — "Klee One" (manga/UTF-8 friendly, bundled).  Built
+# lazily (needs a QGuiApplication) and shared by every new bubble.
+_DEFAULT_FONT: QFont | None = None
+
+
+def _default_font() -> QFont:
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        _DEFAULT_FONT = QFont("Klee One", 20)
+        _DEFAULT_FONT.setBold(True)
+    return _DEFAULT_FONT
+
+
+@functools.lru_cache(maxsize=256)
+def _caption_text_path(font_desc: str, text: str,
+                       width: float) -> tuple[QPainterPath, float]:
+    """Glyph outlines for word-wrapped, centred caption text at the origin.
+
+    Returns (path, block_height).  Shaping happens once per (font, text,
+    width); the caption paint then strokes and fills the cached outlines
+    instead of shaping the string nine times per repaint.
+    """
+    font = QFont()
+    font.fromString(font_desc)
+    layout = QTextLayout(text.replace("\n", "\u2028"), font)
+    opt = QTextOption(Qt.AlignmentFlag.AlignHCenter)
+    opt.setWrapMode(QTextOption.WrapMode.WordWrap)
+    layout.setTextOption(opt)
+    layout.beginLayout()
+    y = 0.0
+    while True:
+        line = layout.createLine()
+        if not line.isValid():
+            break
+        line.setLineWidth(width)
+        line.setPosition(QPointF(0, y))
+        y += line.height()
+    layout.endLayout()
+
+    path = QPainterPath()
+    for run in layout.glyphRuns():
+        raw = run.rawFont()
+        for glyph, pos in zip(run.glyphIndexes(), run.positions()):
+            path.addPath(raw.pathForGlyph(glyph).translated(pos))
+    return path, y
 
 
 # ---------------------------------------------------------------------------
@@ -41,11 +152,14 @@ class TailHandle(QGraphicsEllipseItem):
     Manual drag (no ItemIsMovable) so it doesn't fight parent item movement.
     """
 
+    __slots__ = ("_bubble", "_dragging", "_hidden")
+
     def __init__(self, parent_bubble: "BubbleItem"):
         r = TAIL_DOT_R
         super().__init__(-r, -r, r * 2, r * 2, parent_bubble)
         self._bubble   = parent_bubble
         self._dragging = False
+        self._hidden: list[QGraphicsItem] = []   # siblings hidden during a drag
 
         self.setBrush(QBrush(QColor("#f87171")))
         self.setPen(QPen(QColor("#0f1319"), 2.0))
@@ -55,29 +169,41 @@ class TailHandle(QGraphicsEllipseItem):
         self.setToolTip("Drag to repoint tail")
 
     def mousePressEvent(self, event: QGraphicsSceneMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton:
+        if event.button() == _LEFT:
             self._dragging = True
+            self._hidden = self._bubble._hide_drag_chrome(self)
             event.accept()
         else:
             event.ignore()
 
     def mouseMoveEvent(self, event: QGraphicsSceneMouseEvent):
         if self._dragging:
-            new_pos = self._bubble.mapFromScene(event.scenePos())
-            self.setPos(new_pos)
-            self._bubble.prepareGeometryChange()
-            self._bubble.update()
+            bubble = self._bubble
+            self.setPos(bubble.mapFromScene(event.scenePos()))
+            # Coalesce high-rate mouse moves; the release flushes the last one.
+            if bubble._last_repaint.elapsed() >= DRAG_FRAME_MS:
+                bubble._last_repaint.restart()
+                self._refresh_bubble()
             event.accept()
         else:
             event.ignore()
 
     def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton:
+        if event.button() == _LEFT:
+            if self._dragging:
+                self._refresh_bubble()
+                self._bubble._restore_drag_chrome(self._hidden)
+                self._hidden = []
             self._dragging = False
             event.accept()
         else:
             event.ignore()
 
+    def _refresh_bubble(self):
+        self._bubble._invalidate_path_cache()
+        self._bubble.prepareGeometryChange()
+        self._bubble.update()
+
 
 # ---------------------------------------------------------------------------
 # ResizeHandle
@@ -91,6 +217,9 @@ class ResizeHandle(QGraphicsRectItem):
         "ML": Qt.CursorShape.SizeHorCursor,   "MR": Qt.CursorShape.SizeHorCursor,
     }
 
+    __slots__ = ("_anchor", "_bubble", "_dragging", "_start_mouse",
+                 "_start_rect", "_drag_rect", "_hidden")
+
     def __init__(self, anchor: str, parent_bubble: "BubbleItem"):
         s = HANDLE_SIZE
         super().__init__(-s / 2, -s / 2, s, s, parent_bubble)
@@ -99,6 +228,8 @@ class ResizeHandle(QGraphicsRectItem):
         self._dragging    = False
         self._start_mouse = QPointF()
         self._start_rect  = QRectF()
+        self._drag_rect   = QRectF()   # latest rect, applied on release if throttled
+        self._hidden: list[QGraphicsItem] = []   # siblings hidden during a drag
 
         self.setBrush(QBrush(QColor("#46ddcb")))
         self.setPen(QPen(QColor("#0f1319"), 1.5))
@@ -107,10 +238,13 @@ class ResizeHandle(QGraphicsRectItem):
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, False)
 
     def mousePressEvent(self, event: QGraphicsSceneMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton:
+        if event.button() == _LEFT:
             self._dragging    = True
             self._start_mouse = event.scenePos()
             self._start_rect  = QRectF(self._bubble.body_rect)
+            self._drag_rect   = QRectF()
+            self._hidden      = self._bubble._hide_drag_chrome(self)
+            self._bubble._begin_resize_preview()
             event.accept()
         else:
             event.ignore()
@@ -134,18 +268,27 @@ class ResizeHandle(QGraphicsRectItem):
             nb = r.bottom() + delta.y()
             if nb - r.top() >= MIN: r.setBottom(nb)
 
-        self._bubble.set_body_rect(r)
+        self._drag_rect = r
+        bubble = self._bubble
+        if bubble._last_repaint.elapsed() >= DRAG_FRAME_MS:
+            bubble._last_repaint.restart()
+            bubble._set_resize_preview_rect(r)
         event.accept()
 
     def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent):
-        if self._dragging and event.button() == Qt.MouseButton.LeftButton:
+        if self._dragging and event.button() == _LEFT:
             self._dragging = False
+            # The real geometry (paths, text reflow) is rebuilt once, here.
+            self._bubble._end_resize_preview()
+            self._bubble._restore_drag_chrome(self._hidden)
+            self._hidden = []
+            if not self._drag_rect.isNull() and self._drag_rect != self._bubble.body_rect:
+                self._bubble.set_body_rect(self._drag_rect)
             old_rect = self._start_rect
             new_rect = self._bubble.body_rect
             if old_rect != new_rect:
                 stack = self._bubble._undo_stack()
                 if stack:
-                    from undo_commands import ResizeBubbleCommand
                     stack.push(ResizeBubbleCommand(self._bubble, old_rect, new_rect))
         event.accept()
 
@@ -163,6 +306,11 @@ class BubbleItem(QGraphicsItem):
 
         hw, hh = DEFAULT_W / 2, DEFAULT_H / 2
         self._body_rect = QRectF(-hw, -hh, DEFAULT_W, DEFAULT_H)
+        # Allowed pos() range (min_x, max_x, min_y, max_y) for the drag clamp;
+        # dropped when the body rect or the scene rect changes.
+        self._clamp_bounds: tuple | None = None
+        # The owning scene's QUndoStack, captured on scene attach.
+        self._undo_stack_ref = None
 
         self._style        = DEFAULT_STYLE
         self._fill_color   = QColor(255, 255, 255, 240)
@@ -193,6 +341,34 @@ class BubbleItem(QGraphicsItem):
         self._text_before_edit: str | None    = None   # set on double-click
         self._is_editing:      bool           = False  # True while text editor is open
 
+        # shape() cache: body ∪ tail is a polygon boolean, and Qt asks for the
+        # shape on every hover / hit-test even when nothing has changed.
+        self._merged_path_cache: QPainterPath | None = None
+        self._merged_path_key:   tuple | None        = None
+        # Rect-style shape() and boundingRect() results, keyed on their inputs
+        # (the shadow is the one input outside the key; set_shadow clears it).
+        self._rect_shape_cache: QPainterPath | None = None
+        self._rect_shape_key:   tuple | None        = None
+        self._bounding_cache:   QRectF | None       = None
+        self._bounding_key:     tuple | None        = None
+        # Body outlines per (style, w, h), built at the origin and translated
+        # onto the body rect — paint, shape and edge searches all reuse them.
+        self._path_cache: dict[tuple[str, float, float], QPainterPath] = {}
+        self._tail_vec_cache:   tuple | None        = None
+        self._tail_vec_key:     tuple | None        = None
+        # Resize preview: while a resize handle is dragged, paint() blits a
+        # snapshot (pixmap, snapshot bounds, snapshot body rect, target
+        # bounds, target body rect) instead of rebuilding paths and text.
+        self._resize_preview: tuple | None = None
+        self._text_hidden_for_preview = False
+        # Shared by the tail and resize handles to throttle drag repaints.
+        self._last_repaint = QElapsedTimer()
+        self._last_repaint.start()
+        # Cloud silhouette (9 merged circles) at the origin, keyed on (w, h);
+        # translated onto the body rect per call.
+        self._cloud_cache: tuple[tuple | None, QPainterPath | None] = (None, None)
+        self._cloud_fill_cache: tuple[tuple | None, QPainterPath | None] = (None, None)
+
         # Tail handle
         self._tail = TailHandle(self)
         self._tail.setPos(0, hh + 70)
@@ -200,15 +376,15 @@ class BubbleItem(QGraphicsItem):
 
         # Text — default font is "Klee One" (manga/UTF-8 friendly, bundled).
         # Falls back gracefully to system fonts if the file isn't present.
-        _default_font = QFont("Klee One", 20)
-        _default_font.setBold(True)
         self._font_pt: int = 20          # user's preferred point size; auto-shrink
                                           # may reduce it temporarily but will try
                                           # to restore it when text is removed.
+        self._laying_out = False         # True while _reposition_text() runs
+        self._layout_pending = False     # contentsChanged layout queued
         self._text_item = QGraphicsTextItem(self)
         self._text_item.setPlainText("Type here...")
         self._text_item.setDefaultTextColor(QColor(15, 15, 15))
-        self._text_item.setFont(_default_font)
+        self._text_item.setFont(_default_font())
         self._text_item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, False)
         self._text_item.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
         # Grow / shrink font in real time as the user types or pastes text
@@ -224,6 +400,8 @@ class BubbleItem(QGraphicsItem):
         self._update_handle_positions()
         if style != DEFAULT_STYLE:
             self.set_style(style)
+        else:
+            self._update_cache_mode()
 
     # ------------------------------------------------------------------
     # Getters (used by PropertiesPanel)
@@ -292,14 +470,14 @@ class BubbleItem(QGraphicsItem):
         # prepareGeometryChange() BEFORE we change anything so Qt invalidates
         # the OLD bounding rect (which included the tail area).
         # Without this, switching styles can leave ghost artefacts on screen.
+        self._invalidate_path_cache()
+        self._path_cache.clear()
         self.prepareGeometryChange()
-        if self.scene():
-            self.scene().update()   # force full scene repaint for good measure
         prev_style = self._style
         self._style = style
         # Tail is hidden for styles that have no tail
         self._tail.setVisible(
-            self.isSelected() and style not in ("text", "rect", "scrim", "caption"))
+            self.isSelected() and style in _TAIL_STYLES)
 
         # Switching AWAY from scrim: body_rect is still full-canvas-width and
         # flat, which breaks cloud/oval/spiky shape geometry (Audi logo effect).
@@ -357,25 +535,50 @@ class BubbleItem(QGraphicsItem):
             self._text_item.setVisible(True)
             self._text_item.setDefaultTextColor(QColor(15, 15, 15))
 
+        self._update_cache_mode()
         self.update()
         self._notify_changed()
 
+    def _update_cache_mode(self):
+        """Blit the bubble from a device pixmap between appearance changes.
+
+        Every setter already calls update(), which also refreshes the cache.
+        Captions are left uncached: their stroke text is edited in place and
+        changes too often for the cache to pay off.
+        """
+        if self._style == "caption":
+            self.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+        else:
+            self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
     def set_fill_color(self, color: QColor):
+        if color == self._fill_color:
+            return
         self._fill_color = color
         self.update()
         self._notify_changed()
 
     def set_border_color(self, color: QColor):
+        if color == self._border_color:
+            return
         self._border_color = color
         self.update()
         self._notify_changed()
 
     def set_border_width(self, w: float):
+        if w == self._border_width:
+            return
         self._border_width = w
         self.update()
         self._notify_changed()
 
     def set_body_rect(self, rect: QRectF):
+        if rect == self._body_rect:
+            return   # clamped resize move — nothing changed
+        self._invalidate_path_cache()
+        if rect.size() != self._body_rect.size():
+            # Outlines are size-keyed templates; a pure move reuses them.
+            self._path_cache.clear()
         self.prepareGeometryChange()
         self._body_rect = QRectF(rect)
         # When the user manually resizes the bubble, try to restore the
@@ -399,12 +602,20 @@ class BubbleItem(QGraphicsItem):
         self._notify_changed()
 
     def set_text_color(self, color: QColor):
+        if color == self._text_item.defaultTextColor():
+            return
         self._text_item.setDefaultTextColor(color)
         self.update()
         self._notify_changed()
 
     def set_text(self, text: str):
-        self._text_item.setPlainText(text)
+        # Lay out once below rather than also via the contentsChanged slot.
+        doc = self._text_item.document()
+        doc.contentsChanged.disconnect(self._on_text_contents_changed)
+        try:
+            self._text_item.setPlainText(text)
+        finally:
+            doc.contentsChanged.connect(self._on_text_contents_changed)
         self._reposition_text()
         self.update()
         self._notify_changed()
@@ -436,6 +647,7 @@ class BubbleItem(QGraphicsItem):
         if old_enabled or new_shadow.get("enabled", False):
             self.prepareGeometryChange()
         self._shadow = new_shadow
+        self._bounding_key = None
         self.update()
         self._notify_changed()
 
@@ -444,6 +656,15 @@ class BubbleItem(QGraphicsItem):
     # ------------------------------------------------------------------
 
     def _reposition_text(self):
+        # setFont()/setTextWidth() below re-emit contentsChanged; the guard
+        # stops that from recursing back into a second layout pass.
+        self._laying_out = True
+        try:
+            self._layout_text()
+        finally:
+            self._laying_out = False
+
+    def _layout_text(self):
         r     = self._body_rect
         style = self._style
 
@@ -475,14 +696,32 @@ class BubbleItem(QGraphicsItem):
         needed_h = th + v_pad
 
         # Font shrink: only fires when text would push bubble past its cap.
-        if needed_h > cap_h:
+        # Wrapped text area grows with pt², so jump straight to the estimated
+        # fit and walk the last point or two rather than stepping down 1 pt
+        # (one full text layout) at a time.
+        if needed_h > cap_h and self._text_item.font().pointSize() > 7:
             font = QFont(self._text_item.font())
-            while font.pointSize() > 7 and needed_h > cap_h:
-                font.setPointSize(font.pointSize() - 1)
+            start_pt = font.pointSize()
+
+            def measure(pt: int) -> float:
+                font.setPointSize(pt)
                 self._text_item.setFont(font)
                 self._text_item.setTextWidth(tw)
-                th       = self._text_item.boundingRect().height()
-                needed_h = th + v_pad
+                return self._text_item.boundingRect().height()
+
+            pt = max(7, min(start_pt - 1,
+                            int(start_pt * math.sqrt(max(cap_h - v_pad, 1.0) / th))))
+            th = measure(pt)
+            while pt > 7 and th + v_pad > cap_h:
+                pt -= 1
+                th = measure(pt)
+            while pt + 1 < start_pt and th + v_pad <= cap_h:
+                bigger = measure(pt + 1)
+                if bigger + v_pad > cap_h:
+                    th = measure(pt)
+                    break
+                pt, th = pt + 1, bigger
+            needed_h = th + v_pad
 
         # Primary behaviour: grow the bubble body to fit the text.
         if r.height() < needed_h:
@@ -491,6 +730,7 @@ class BubbleItem(QGraphicsItem):
             self._body_rect = QRectF(r.left(), cy - needed_h / 2,
                                      r.width(), needed_h)
             r = self._body_rect
+            self._clamp_bounds = None
             self._update_handle_positions()
 
         # Centre text horizontally and vertically within the body rect.
@@ -503,20 +743,29 @@ class BubbleItem(QGraphicsItem):
         """Called whenever the text document changes (typing or paste).
 
         Re-runs layout so the bubble grows or shrinks font in real time.
+        The text item repaints itself and any body growth goes through
+        prepareGeometryChange(); only captions draw the text in paint().
         """
+        if self._laying_out or self._layout_pending:
+            return
+        # Coalesce: a paste or fast typing emits many contentsChanged
+        # signals, but one layout per event-loop pass is enough.
+        self._layout_pending = True
+        QTimer.singleShot(0, self._flush_layout)
+
+    def _flush_layout(self):
+        if not self._layout_pending or sip.isdeleted(self):
+            return
+        self._layout_pending = False
         self._reposition_text()
-        self.update()
+        if self._style == "caption":
+            self.update()
 
-    def _update_handle_positions(self):
-        r  = self._body_rect
-        cx, cy = r.center().x(), r.center().y()
-        l, t, ri, b = r.left(), r.top(), r.right(), r.bottom()
-        for anchor, (x, y) in {
-            "TL":(l,t),"TC":(cx,t),"TR":(ri,t),
-            "ML":(l,cy),            "MR":(ri,cy),
-            "BL":(l,b),"BC":(cx,b),"BR":(ri,b),
-        }.items():
-            self._handles[anchor].setPos(x, y)
+    def _update_handle_positions(self, r: QRectF | None = None):
+        r  = self._body_rect if r is None else r
+        l, t, w, h = r.left(), r.top(), r.width(), r.height()
+        for anchor, fx, fy in _ANCHOR_OFFSETS:
+            self._handles[anchor].setPos(l + fx * w, t + fy * h)
 
     def _tail_pos_for(self, position: str) -> QPointF:
         r = self._body_rect
@@ -538,14 +787,23 @@ class BubbleItem(QGraphicsItem):
     # ------------------------------------------------------------------
 
     def boundingRect(self) -> QRectF:
+        if self._resize_preview is not None:
+            return self._resize_preview[3]
+        tip = self._tail.pos()
+        key = (self._body_rect.getCoords(), self._style, tip.x(), tip.y())
+        if key == self._bounding_key:
+            return self._bounding_cache
         pad = HANDLE_SIZE + 2
         r   = self._body_rect.adjusted(-pad, -pad, pad, pad)
         if self._style in ("text", "scrim", "caption"):
-            return self._shadow_adjusted_rect(r)
-        tip = self._tail.pos()
-        tip_r = QRectF(tip.x()-TAIL_DOT_R, tip.y()-TAIL_DOT_R,
-                       TAIL_DOT_R*2, TAIL_DOT_R*2)
-        return self._shadow_adjusted_rect(r.united(tip_r))
+            rect = self._shadow_adjusted_rect(r)
+        else:
+            tip_r = QRectF(tip.x()-TAIL_DOT_R, tip.y()-TAIL_DOT_R,
+                           TAIL_DOT_R*2, TAIL_DOT_R*2)
+            rect = self._shadow_adjusted_rect(r.united(tip_r))
+        self._bounding_cache = rect
+        self._bounding_key   = key
+        return rect
 
     def _shadow_adjusted_rect(self, rect: QRectF) -> QRectF:
         if not self._shadow.get("enabled", False):
@@ -557,15 +815,35 @@ class BubbleItem(QGraphicsItem):
         return rect.united(shadow)
 
     def shape(self) -> QPainterPath:
-        if self._style in ("text", "rect", "scrim", "caption"):
-            p = QPainterPath()
-            p.addRect(self._body_rect)
-            return p
-        body = self._build_body_path()
-        if self._style == "cloud":
-            return body
-        tail = self._triangle_tail_path(self._tail.pos())
-        return body.united(tail)
+        if self._style not in _TAIL_STYLES:
+            key = self._body_rect.getCoords()
+            if key != self._rect_shape_key:
+                p = QPainterPath()
+                p.addRect(self._body_rect)
+                self._rect_shape_cache = p
+                self._rect_shape_key   = key
+            return self._rect_shape_cache
+        return self._merged_path()
+
+    def _merged_path(self) -> QPainterPath:
+        """Body united with the tail, rebuilt only when an input changes."""
+        tip = self._tail.pos()
+        key = (self._style, self._body_rect.getCoords(),
+               tip.x(), tip.y(), self._tail_width)
+        if key != self._merged_path_key:
+            body = self._build_body_path()
+            if self._style != "cloud":
+                body = body.united(self._triangle_tail_path(tip))
+            self._merged_path_cache = body
+            self._merged_path_key   = key
+        return self._merged_path_cache
+
+    def _invalidate_path_cache(self):
+        """Drop cached geometry — call before the body rect, style or tail move."""
+        self._merged_path_key = None
+        self._rect_shape_key  = None
+        self._bounding_key    = None
+        self._clamp_bounds    = None
 
     def paint(self, painter: QPainter,
               option: QStyleOptionGraphicsItem,
@@ -573,6 +851,15 @@ class BubbleItem(QGraphicsItem):
 
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        if self._resize_preview is not None:
+            pm, _, _, target, body = self._resize_preview
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.drawPixmap(target, pm, QRectF(pm.rect()))
+            painter.setPen(QPen(QColor("#46ddcb"), 1.5, Qt.PenStyle.DashLine))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(body)
+            return
+
         if self._style == "text":
             # No body — just show selection indicator when selected
             if self.isSelected():
@@ -584,34 +871,37 @@ class BubbleItem(QGraphicsItem):
 
         if self._style == "caption":
             # Stroke text overlay: optional background rect, then outline
-            # (8-direction shadow using _border_color + _border_width as offset),
-            # then text fill (_text_item.defaultTextColor).
+            # (glyph outlines stroked at 2 × _border_width so _border_width
+            # shows outside each glyph), then text fill on top
+            # (_text_item.defaultTextColor).
             # _text_item is hidden; everything is painted manually here.
             text = self._text_item.toPlainText()
             if text:
-                painter.setFont(self._text_item.font())
                 tp    = self._text_item.pos()
                 tw    = self._text_item.textWidth()
                 th    = self._text_item.boundingRect().height()
                 tr    = QRectF(tp.x(), tp.y(), tw, th)
-                flags = (int(Qt.AlignmentFlag.AlignCenter) |
-                         int(Qt.TextFlag.TextWordWrap))
                 # Background rect — only drawn when fill has any opacity
                 if self._fill_color.alpha() > 0:
                     pad = 6
                     painter.fillRect(tr.adjusted(-pad, -pad, pad, pad),
                                      self._fill_color)
-                # Outline via 8-direction offset; thickness controlled by border_width
+                glyphs, block_h = _caption_text_path(
+                    self._text_item.font().toString(), text, tw)
+                glyphs = glyphs.translated(tr.x(), tr.y() + (th - block_h) / 2)
+                # Outline thickness controlled by border_width
                 off = max(1, round(self._border_width)) if self._border_width > 0 else 0
                 if off > 0:
-                    painter.setPen(self._border_color)
-                    for ox, oy in [(-off,-off),(0,-off),(off,-off),
-                                   (-off,  0),          (off,  0),
-                                   (-off, off),(0, off),(off, off)]:
-                        painter.drawText(tr.adjusted(ox, oy, ox, oy), flags, text)
+                    painter.setPen(QPen(self._border_color, off * 2,
+                                        Qt.PenStyle.SolidLine,
+                                        Qt.PenCapStyle.RoundCap,
+                                        Qt.PenJoinStyle.RoundJoin))
+                    painter.setBrush(Qt.BrushStyle.NoBrush)
+                    painter.drawPath(glyphs)
                 # Text colour fill on top
-                painter.setPen(self._text_item.defaultTextColor())
-                painter.drawText(tr, flags, text)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(self._text_item.defaultTextColor())
+                painter.drawPath(glyphs)
             if self.isSelected():
                 painter.setPen(QPen(QColor("#46ddcb"), 1.5,
                                     Qt.PenStyle.DashLine))
@@ -627,11 +917,18 @@ class BubbleItem(QGraphicsItem):
         tip   = self._tail.pos()
 
         if self._style == "cloud":
-            self._paint_shadow(painter, self._cloud_path(self._body_rect))
-            # Cloud body and thought dots drawn separately (dots are distinct circles)
+            fill = self._cloud_fill_path(self._body_rect)
+            self._paint_shadow(painter, fill)
+            # Cloud body and thought dots drawn separately (dots are distinct circles).
+            # Fill the raw overlapping bumps (winding rule, so overlaps blend
+            # once) and keep the merged outline for the border only.
+            painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(brush)
+            painter.drawPath(fill)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.setPen(pen)
             painter.drawPath(self._cloud_path(self._body_rect))
+            painter.setBrush(brush)
 
             # Thought dots: same fill, same border
             painter.drawPath(self._thought_dots_path(tip))
@@ -639,17 +936,19 @@ class BubbleItem(QGraphicsItem):
         elif self._style == "rect":
             path = self._rect_with_tail_path(tip)
             self._paint_shadow(painter, path)
-            painter.setBrush(brush)
-            painter.setPen(pen)
-            painter.drawPath(path)
+            r = self._body_rect
+            self._draw_cached_fill(
+                painter, path, pen, brush,
+                f"rect:{tip.x() - r.left():.1f},{tip.y() - r.top():.1f}"
+                f":{self._tail_width}")
 
         elif self._style == "scrim":
             self._paint_shadow(painter, self._build_body_path())
             # Dark semi-transparent horizontal strip — full-width, no tail
-            painter.setBrush(brush)
-            painter.setPen(pen if self._border_width > 0
-                           else QPen(Qt.PenStyle.NoPen))
-            painter.drawPath(self._build_body_path())
+            self._draw_cached_fill(
+                painter, self._build_body_path(),
+                pen if self._border_width > 0 else QPen(Qt.PenStyle.NoPen),
+                brush, "scrim")
 
         else:
             if self._style == "oval":
@@ -670,12 +969,103 @@ class BubbleItem(QGraphicsItem):
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRect(self._body_rect)
 
+    # ------------------------------------------------------------------
+    # Drag chrome
+    # ------------------------------------------------------------------
+
+    def _hide_drag_chrome(self, active: QGraphicsItem) -> list[QGraphicsItem]:
+        """Hide the handles and tail dot except 'active' for the length of a
+        drag, so they are not repainted on every move.  Returns what was hidden."""
+        hidden = [item for item in (*self._handles.values(), self._tail)
+                  if item is not active and item.isVisible()]
+        for item in hidden:
+            item.setVisible(False)
+        return hidden
+
+    def _restore_drag_chrome(self, hidden: list[QGraphicsItem]):
+        if not self.isSelected():
+            return   # deselected mid-drag: leave them hidden
+        for item in hidden:
+            item.setVisible(True)
+
+    # ------------------------------------------------------------------
+    # Resize preview (freeze-and-blit)
+    # ------------------------------------------------------------------
+
+    def _render_to_pixmap(self) -> tuple[QPixmap, QRectF]:
+        """Rasterise the bubble (and its text) over boundingRect() at view scale."""
+        br = self.boundingRect()
+        scale = 1.0
+        scene = self.scene()
+        if scene and scene.views():
+            view  = scene.views()[0]
+            scale = view.transform().m11() * view.devicePixelRatioF()
+        scale = max(0.25, min(scale, 4.0))
+        pm = QPixmap(max(1, math.ceil(br.width() * scale)),
+                     max(1, math.ceil(br.height() * scale)))
+        pm.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pm)
+        painter.scale(scale, scale)
+        painter.translate(-br.left(), -br.top())
+        opt = QStyleOptionGraphicsItem()
+        self.paint(painter, opt, None)
+        if self._text_item.isVisible():
+            painter.translate(self._text_item.pos())
+            self._text_item.paint(painter, opt, None)
+        painter.end()
+        return pm, br
+
+    def _begin_resize_preview(self):
+        pm, br = self._render_to_pixmap()
+        body = QRectF(self._body_rect)
+        self._resize_preview = (pm, br, body, QRectF(br), body)
+        # The snapshot already contains the text; the live item would not scale.
+        self._text_hidden_for_preview = self._text_item.isVisible()
+        self._text_item.setVisible(False)
+        self.update()
+
+    def _set_resize_preview_rect(self, r: QRectF):
+        """Stretch the snapshot so its body maps onto r — no path or text work."""
+        if self._resize_preview is None:
+            self.set_body_rect(r)
+            return
+        pm, br, body = self._resize_preview[:3]
+        sx = r.width()  / body.width()  if body.width()  else 1.0
+        sy = r.height() / body.height() if body.height() else 1.0
+        target = QRectF(r.left() + (br.left() - body.left()) * sx,
+                        r.top()  + (br.top()  - body.top())  * sy,
+                        br.width() * sx, br.height() * sy)
+        self.prepareGeometryChange()
+        self._resize_preview = (pm, br, body, target, QRectF(r))
+        self._update_handle_positions(r)
+        self.update()
+
+    def _end_resize_preview(self):
+        if self._resize_preview is None:
+            return
+        self.prepareGeometryChange()
+        self._resize_preview = None
+        if self._text_hidden_for_preview:
+            self._text_item.setVisible(True)
+            self._text_hidden_for_preview = False
+        self._update_handle_positions()
+        self.update()
+
     # ------------------------------------------------------------------
     # Shape builders
     # ------------------------------------------------------------------
 
     def _build_body_path(self) -> QPainterPath:
         r = self._body_rect
+        w, h = r.width(), r.height()
+        key = (self._style, w, h)
+        template = self._path_cache.get(key)
+        if template is None:
+            template = self._body_path_for(QRectF(0, 0, w, h))
+            self._path_cache[key] = template
+        return template.translated(r.left(), r.top())
+
+    def _body_path_for(self, r: QRectF) -> QPainterPath:
         path = QPainterPath()
         if self._style == "oval":
             path = self._organic_oval_path(r)
@@ -691,6 +1081,72 @@ class BubbleItem(QGraphicsItem):
             path.addEllipse(r)
         return path
 
+    def _draw_cached_fill(self, painter: QPainter, path: QPainterPath,
+                          pen: QPen, brush: QBrush, tag: str):
+        """Blit a filled + stroked path from QPixmapCache.
+
+        Rect and scrim bodies are plain raster, so every bubble with the same
+        size, colours, border, device scale and sub-pixel phase shares one
+        cached pixmap.  'tag' must describe any geometry beyond the body size
+        (e.g. the tail).
+
+        The pixmap is rasterised in device pixels (deviceTransform includes
+        the devicePixelRatio) and tagged with that ratio, so it is blitted
+        1:1 onto HiDPI devices too.
+        """
+        t = painter.deviceTransform()
+        scale = t.m11()
+        dpr = painter.device().devicePixelRatioF()
+        pw = 0.0 if pen.style() == Qt.PenStyle.NoPen else pen.widthF()
+        bounds = path.boundingRect().adjusted(-pw / 2 - 2, -pw / 2 - 2,
+                                              pw / 2 + 2, pw / 2 + 2)
+        w_px = math.ceil(bounds.width() * scale) + 1
+        h_px = math.ceil(bounds.height() * scale) + 1
+        if (t.isRotating() or not t.isAffine() or scale <= 0
+                or t.m22() != scale or w_px * h_px > _PIXMAP_CACHE_MAX_PX):
+            # Rotated / sheared / huge: not worth caching.
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            painter.drawPath(path)
+            return
+
+        # Blit on whole device pixels; the fractional offset (to 1/4 px) is
+        # baked into the pixmap so edges anti-alias exactly as drawPath would.
+        dev = t.map(bounds.topLeft())
+        ix, iy = math.floor(dev.x()), math.floor(dev.y())
+        fx = round((dev.x() - ix) * 4) / 4
+        fy = round((dev.y() - iy) * 4) / 4
+
+        r = self._body_rect
+        key = (f"bubble:{tag}:{r.width():.1f}x{r.height():.1f}"
+               f":{brush.color().rgba()}:{pen.color().rgba()}:{pw}"
+               f":{scale:.4f}:{dpr}:{fx},{fy}")
+        pm = QPixmapCache.find(key)
+        if pm is None:
+            pm = QPixmap(w_px, h_px)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.GlobalColor.transparent)
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            p.scale(1 / dpr, 1 / dpr)     # work in the pixmap's device pixels
+            p.translate(fx, fy)
+            p.scale(scale, scale)
+            p.translate(-bounds.left(), -bounds.top())
+            p.setPen(pen)
+            p.setBrush(brush)
+            p.drawPath(path)
+            p.end()
+            QPixmapCache.insert(key, pm)
+        # resetTransform still leaves the device's pixel ratio and any widget
+        # redirection offset (e.g. a QGraphicsView frame) in deviceTransform,
+        # and both are already part of (ix, iy) — map back through them so
+        # they aren't applied twice.
+        painter.save()
+        painter.resetTransform()
+        base, _ = painter.deviceTransform().inverted()
+        painter.drawPixmap(base.map(QPointF(ix, iy)), pm)
+        painter.restore()
+
     def _paint_shadow(self, painter: QPainter, path: QPainterPath):
         if not self._shadow.get("enabled", False):
             return
@@ -711,8 +1167,8 @@ class BubbleItem(QGraphicsItem):
         Asymmetric comic oval using cubic bezier curves.
         It avoids the perfectly mechanical addEllipse() look.
         """
-        cx, cy = r.center().x(), r.center().y()
-        w2, h2 = r.width() / 2, r.height() / 2
+        w2, h2 = r.width() * 0.5, r.height() * 0.5
+        cx, cy = r.left() + w2, r.top() + h2
 
         path = QPainterPath()
         path.moveTo(cx - w2 * 0.14, cy - h2 * 0.92)
@@ -737,13 +1193,8 @@ class BubbleItem(QGraphicsItem):
         The base is found on the body outline, so the tail reads like part of
         the bubble instead of a triangle starting from the centre.
         """
-        r  = self._body_rect
-        cx, cy = r.center().x(), r.center().y()
-        dx = tip.x() - cx
-        dy = tip.y() - cy
-        dist = math.hypot(dx, dy) or 1
-        ux, uy = dx / dist, dy / dist
-        nx, ny = dy / dist, -dx / dist
+        _, _, ux, uy, dist = self._tail_vec(tip)
+        nx, ny = uy, -ux
         half = self._tail_width / 2
         edge = self._body_edge_point(tip)
         base = QPointF(edge.x() + ux * 2.0, edge.y() + uy * 2.0)
@@ -771,8 +1222,8 @@ class BubbleItem(QGraphicsItem):
 
     def _oval_with_tail_path(self, tip: QPointF) -> QPainterPath:
         r = self._body_rect
-        cx, cy = r.center().x(), r.center().y()
-        w2, h2 = r.width() / 2, r.height() / 2
+        w2, h2 = r.width() * 0.5, r.height() * 0.5
+        cx, cy = r.left() + w2, r.top() + h2
         side = self._tail_side(tip)
 
         if side == "bottom":
@@ -883,6 +1334,22 @@ class BubbleItem(QGraphicsItem):
         path.closeSubpath()
         return path
 
+    def _tail_vec(self, tip: QPointF) -> tuple[float, float, float, float, float]:
+        """(cx, cy, ux, uy, dist): body centre, unit vector and distance to tip.
+
+        Tail, edge and thought-dot builders all need this for the same tip
+        during one paint, so the last result is kept.
+        """
+        c = self._body_rect.center()
+        cx, cy, tx, ty = c.x(), c.y(), tip.x(), tip.y()
+        key = (cx, cy, tx, ty)
+        if key != self._tail_vec_key:
+            dx, dy = tx - cx, ty - cy
+            dist = max(math.hypot(dx, dy), 1e-6)
+            self._tail_vec_key = key
+            self._tail_vec_cache = (cx, cy, dx / dist, dy / dist, dist)
+        return self._tail_vec_cache
+
     def _tail_side(self, tip: QPointF) -> str:
         r = self._body_rect
         c = r.center()
@@ -894,11 +1361,7 @@ class BubbleItem(QGraphicsItem):
 
     def _body_edge_point(self, tip: QPointF) -> QPointF:
         r = self._body_rect
-        cx, cy = r.center().x(), r.center().y()
-        dx = tip.x() - cx
-        dy = tip.y() - cy
-        dist = math.hypot(dx, dy) or 1
-        ux, uy = dx / dist, dy / dist
+        cx, cy, ux, uy, dist = self._tail_vec(tip)
         body = self._build_body_path()
         max_search = min(dist, max(r.width(), r.height()) * 1.5)
         lo, hi = 0.0, max_search
@@ -913,29 +1376,30 @@ class BubbleItem(QGraphicsItem):
 
     def _cloud_edge_distance(self, tip: QPointF) -> float:
         """
-        Binary-search for the distance from the body centre at which the ray
-        toward 'tip' exits the cloud body path.  This is direction-aware, so
-        the thought dots always start just outside the cloud regardless of
-        which way the tail is pointing.
+        Distance from the body centre at which the ray toward 'tip' exits the
+        cloud body.  This is direction-aware, so the thought dots always start
+        just outside the cloud regardless of which way the tail is pointing.
+
+        The cloud is a union of circles, so the exit point is solved exactly:
+        intersect the ray with every bump and keep the furthest exit root.
+        Past that point no bump contains the ray, so it lies on the outer
+        silhouette even where the ray briefly leaves the cloud between bumps.
         """
         r  = self._body_rect
-        cx, cy = r.center().x(), r.center().y()
-        dx = tip.x() - cx
-        dy = tip.y() - cy
-        dist = math.hypot(dx, dy) or 1
-        ux, uy = dx / dist, dy / dist
+        cx, cy, ux, uy, dist = self._tail_vec(tip)
 
-        cloud = self._cloud_path(r)
-        max_search = min(dist, max(r.width(), r.height()))
-
-        lo, hi = 0.0, max_search
-        for _ in range(20):          # 20 iterations → sub-pixel precision
-            mid = (lo + hi) / 2.0
-            if cloud.contains(QPointF(cx + ux * mid, cy + uy * mid)):
-                lo = mid             # still inside cloud → go further out
-            else:
-                hi = mid             # already outside → pull back
-        return hi + 6               # 6 px gap so the first dot is clearly outside
+        w, h = r.width(), r.height()
+        m = min(w, h)
+        reach = 0.0
+        for fx, fy, fr in _CLOUD_BUMPS:
+            # |C + t·u − B|² = rad²  →  t² − 2bt + c = 0
+            ox = r.left() + fx * w - cx
+            oy = r.top()  + fy * h - cy
+            b = ux * ox + uy * oy
+            disc = b * b - (ox * ox + oy * oy - (fr * m) ** 2)
+            if disc > 0:
+                reach = max(reach, b + math.sqrt(disc))
+        return min(reach, dist, max(w, h)) + 6   # 6 px gap so the first dot is clearly outside
 
     def _thought_dots_path(self, tip: QPointF) -> QPainterPath:
         """
@@ -945,12 +1409,7 @@ class BubbleItem(QGraphicsItem):
         so a short tail shows 2 small dots and a long tail shows up to 5
         larger ones — the tail visually "grows" as the user drags the red dot.
         """
-        r  = self._body_rect
-        cx, cy = r.center().x(), r.center().y()
-        dx = tip.x() - cx
-        dy = tip.y() - cy
-        dist = math.hypot(dx, dy) or 1
-        ux, uy = dx / dist, dy / dist
+        cx, cy, ux, uy, dist = self._tail_vec(tip)
 
         edge      = self._cloud_edge_distance(tip)
         available = max(0.0, dist - edge - 8)   # usable space; 8 px margin before tip
@@ -961,16 +1420,11 @@ class BubbleItem(QGraphicsItem):
         # Scale factor: 1.0 at 60 px of tail, up to 2.2 at ≥ 240 px
         scale = min(2.2, max(0.7, available / 60.0))
 
-        # Dot specs: (fraction_of_available_length, base_radius)
         # Fractions spread dots evenly; radii shrink toward the tip
-        dot_specs = [(0.12, 11), (0.38, 8), (0.60, 6)]
-        if available > 80:
-            dot_specs.append((0.75, 4))
-        if available > 140:
-            dot_specs.append((0.87, 3))
-
         path = QPainterPath()
-        for frac, base_r in dot_specs:
+        for frac, base_r, min_avail in _THOUGHT_DOTS:
+            if available <= min_avail:
+                break
             rad = max(2, int(base_r * scale))
             d   = edge + frac * available
             if d + rad > dist - 5:      # don't overlap tip
@@ -980,108 +1434,90 @@ class BubbleItem(QGraphicsItem):
 
     def _cloud_path(self, r: QRectF) -> QPainterPath:
         """
-        Thought-cloud: 9 circles united into ONE path so the border traces the
-        outer silhouette only — no internal rings (Audi logo effect).
+        Thought-cloud: 9 circles merged into ONE outline so the border traces
+        the outer silhouette only — no internal rings (Audi logo effect).
+
+        The outline only depends on the rect size, so it is built once at the
+        origin and translated onto the body rect.
         """
         w, h = r.width(), r.height()
-        # (fraction-x, fraction-y, radius-fraction-of-min-dimension)
-        bumps = [
-            (0.14, 0.62, 0.22),
-            (0.28, 0.42, 0.28),
-            (0.48, 0.34, 0.31),
-            (0.68, 0.42, 0.28),
-            (0.84, 0.62, 0.22),
-            (0.80, 0.78, 0.23),
-            (0.62, 0.84, 0.26),
-            (0.38, 0.84, 0.26),
-            (0.18, 0.78, 0.21),
-        ]
-        # Start with the first bump and progressively unite the rest.
-        # united() merges all circles into a single outline with no inner borders.
-        path = QPainterPath()
-        for fx, fy, fr in bumps:
-            bx   = r.left() + fx * w
-            by   = r.top()  + fy * h
-            brad = fr * min(w, h)
-            bump = QPainterPath()
-            bump.addEllipse(QPointF(bx, by), brad, brad)
-            path = path.united(bump)
-        return path
+        key, template = self._cloud_cache
+        if key != (w, h):
+            # One simplified() over the winding bump set resolves every
+            # overlap in a single boolean pass (vs. eight chained united()).
+            template = self._cloud_fill_path(QRectF(0, 0, w, h)).simplified()
+            self._cloud_cache = ((w, h), template)
+        return template.translated(r.left(), r.top())
+
+    def _cloud_fill_path(self, r: QRectF) -> QPainterPath:
+        """
+        The cloud's bumps as plain overlapping circles — no boolean ops — for
+        the fill and shadow passes.  WindingFill paints each overlap once,
+        so translucent fills look identical to the merged silhouette.
+        """
+        w, h = r.width(), r.height()
+        key, template = self._cloud_fill_cache
+        if key != (w, h):
+            template = QPainterPath()
+            template.setFillRule(Qt.FillRule.WindingFill)
+            m = min(w, h)
+            for fx, fy, fr in _CLOUD_BUMPS:
+                template.addEllipse(QPointF(fx * w, fy * h), fr * m, fr * m)
+            self._cloud_fill_cache = ((w, h), template)
+        return template.translated(r.left(), r.top())
 
     def _spiky_path(self, r: QRectF) -> QPainterPath:
         """
         Dramatic starburst / shout bubble with 18 spikes of varying height.
         """
-        cx, cy = r.center().x(), r.center().y()
-        rx, ry = r.width() / 2, r.height() / 2
-        spikes = 18
-        path   = QPainterPath()
-
-        for i in range(spikes * 2):
-            angle = math.pi * i / spikes - math.pi / 2
-            if i % 2 == 0:
-                # Spike tip — vary outer radius for an organic, energetic look
-                variation = 1.0 + 0.22 * math.sin(i * 1.9 + 0.8)
-                px = cx + math.cos(angle) * rx * variation
-                py = cy + math.sin(angle) * ry * variation
-            else:
-                # Valley between spikes
-                px = cx + math.cos(angle) * rx * 0.64
-                py = cy + math.sin(angle) * ry * 0.64
-            if i == 0:
-                path.moveTo(px, py)
-            else:
-                path.lineTo(px, py)
+        path = QPainterPath()
+        path.reserve(_SPIKY_ELEMENTS)
+        path.addPolygon(self._spiky_polygon(r))
         path.closeSubpath()
         return path
 
+    @staticmethod
+    def _spiky_polygon(r: QRectF) -> QPolygonF:
+        """The unit starburst scaled and centred onto r."""
+        rx, ry = r.width() * 0.5, r.height() * 0.5
+        return (QTransform.fromTranslate(r.left() + rx, r.top() + ry)
+                .scale(rx, ry)
+                .map(_SPIKY_POLY))
+
     def _spiky_with_tail_path(self, tip: QPointF) -> QPainterPath:
         """
         Starburst with the dragged tail as one native spike.
         This avoids drawing a separate triangle onto the burst silhouette.
         """
         r = self._body_rect
-        cx, cy = r.center().x(), r.center().y()
-        rx, ry = r.width() / 2, r.height() / 2
-        spikes = 18
-        points = []
+        cx, cy = r.left() + r.width() * 0.5, r.top() + r.height() * 0.5
+        points = self._spiky_polygon(r)
 
+        # The spike tip angularly closest to the tail becomes the tail spike.
         tail_angle = math.atan2(tip.y() - cy, tip.x() - cx)
         best_outer = 0
         best_delta = math.inf
-
-        for i in range(spikes * 2):
-            angle = math.pi * i / spikes - math.pi / 2
-            is_outer = i % 2 == 0
-            if is_outer:
-                delta = abs(math.atan2(math.sin(angle - tail_angle), math.cos(angle - tail_angle)))
-                if delta < best_delta:
-                    best_delta = delta
-                    best_outer = i
-                variation = 1.0 + 0.22 * math.sin(i * 1.9 + 0.8)
-                px = cx + math.cos(angle) * rx * variation
-                py = cy + math.sin(angle) * ry * variation
-            else:
-                px = cx + math.cos(angle) * rx * 0.64
-                py = cy + math.sin(angle) * ry * 0.64
-            points.append(QPointF(px, py))
+        for i in range(0, len(_SPIKY_ANGLES), 2):
+            d = (_SPIKY_ANGLES[i] - tail_angle) % math.tau
+            delta = min(d, math.tau - d)
+            if delta < best_delta:
+                best_delta = delta
+                best_outer = i
 
         prev_i = (best_outer - 1) % len(points)
         next_i = (best_outer + 1) % len(points)
         edge = self._body_edge_point(tip)
-        dx = tip.x() - cx
-        dy = tip.y() - cy
-        dist = math.hypot(dx, dy) or 1.0
-        nx, ny = dy / dist, -dx / dist
+        _, _, ux, uy, _ = self._tail_vec(tip)
+        nx, ny = uy, -ux
         half = max(10.0, self._tail_width * 0.42)
 
         points[prev_i] = QPointF(edge.x() + nx * half, edge.y() + ny * half)
         points[best_outer] = QPointF(tip)
         points[next_i] = QPointF(edge.x() - nx * half, edge.y() - ny * half)
 
-        path = QPainterPath(points[0])
-        for point in points[1:]:
-            path.lineTo(point)
+        path = QPainterPath()
+        path.reserve(_SPIKY_ELEMENTS)
+        path.addPolygon(points)
         path.closeSubpath()
         return path
 
@@ -1092,25 +1528,45 @@ class BubbleItem(QGraphicsItem):
     def itemChange(self, change, value):
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionChange:
             # Clamp so the bubble body cannot be dragged outside the canvas.
-            scene = self.scene()
-            if scene:
-                sr = scene.sceneRect()
-                r  = self._body_rect
-                # r edges are in local coords; item pos is the local origin in scene.
-                x = max(sr.left() - r.left(),
-                        min(value.x(), sr.right()  - r.right()))
-                y = max(sr.top()  - r.top(),
-                        min(value.y(), sr.bottom() - r.bottom()))
-                return QPointF(x, y)
+            bounds = self._clamp_bounds
+            if bounds is None:
+                scene = self.scene()
+                if scene:
+                    sr = scene.sceneRect()
+                    r  = self._body_rect
+                    # r edges are in local coords; item pos is the local origin in scene.
+                    bounds = self._clamp_bounds = (
+                        sr.left() - r.left(), sr.right()  - r.right(),
+                        sr.top()  - r.top(),  sr.bottom() - r.bottom())
+            if bounds is not None:
+                mnx, mxx, mny, mxy = bounds
+                vx, vy = value.x(), value.y()
+                x = max(mnx, min(vx, mxx))
+                y = max(mny, min(vy, mxy))
+                # Inside the canvas (the common case): hand Qt its own point back.
+                return value if x == vx and y == vy else QPointF(x, y)
+
+        if change == QGraphicsItem.GraphicsItemChange.ItemSceneChange:
+            old_scene = self.scene()
+            if old_scene:
+                old_scene.sceneRectChanged.disconnect(self._on_scene_rect_changed)
+        if change == QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged:
+            self._clamp_bounds = None
+            self._undo_stack_ref = getattr(value, 'undo_stack', None) if value else None
+            if value:
+                value.sceneRectChanged.connect(self._on_scene_rect_changed)
 
         if change == QGraphicsItem.GraphicsItemChange.ItemSelectedHasChanged:
             selected = bool(value)
             for h in self._handles.values():
                 h.setVisible(selected)
             self._tail.setVisible(
-                selected and self._style not in ("text", "rect", "scrim", "caption"))
+                selected and self._style in _TAIL_STYLES)
         return super().itemChange(change, value)
 
+    def _on_scene_rect_changed(self, _rect: QRectF):
+        self._clamp_bounds = None
+
     def mouseDoubleClickEvent(self, event: QGraphicsSceneMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
             # Snapshot text before editing so we can push an undo command later
@@ -1143,16 +1599,18 @@ class BubbleItem(QGraphicsItem):
             old = self._drag_start_pos
             new = self.pos()
             # Only push a move command if the bubble actually moved
-            if old is not None and (old - new).manhattanLength() > 1:
+            # (Manhattan distance > 1 px, same as QPointF.manhattanLength)
+            if old is not None and (
+                    abs(old.x() - new.x()) + abs(old.y() - new.y()) > 1):
                 stack = self._undo_stack()
                 if stack:
-                    from undo_commands import MoveBubbleCommand
                     stack.push(MoveBubbleCommand(self, old, new))
             self._drag_start_pos = None
 
     def _stop_editing(self):
         """Stop text editing; push TextChangeCommand if text was modified."""
         before = self._text_before_edit
+        self._flush_layout()   # settle the last keystroke's layout now
         self._is_editing = False
         self._text_item.setTextInteractionFlags(
             Qt.TextInteractionFlag.NoTextInteraction)
@@ -1164,14 +1622,12 @@ class BubbleItem(QGraphicsItem):
             if after != before:
                 stack = self._undo_stack()
                 if stack:
-                    from undo_commands import TextChangeCommand
                     stack.push(TextChangeCommand(self, before, after))
             self._text_before_edit = None
 
     def _undo_stack(self):
         """Return the scene's QUndoStack if available, else None."""
-        scene = self.scene()
-        return getattr(scene, 'undo_stack', None) if scene else None
+        return self._undo_stack_ref
 
     def _snap_to_edge(self, edge: str):
         """Snap this rect bubble so it spans the full photo width and sits
@@ -1206,62 +1662,71 @@ class BubbleItem(QGraphicsItem):
         self.set_body_rect(QRectF(-w / 2, -h / 2, w, h))
         self.setPos(sr.center().x(), self.pos().y())
 
-    def contextMenuEvent(self, event: QGraphicsSceneContextMenuEvent):
-        menu = QMenu()
-        act_del   = menu.addAction("Delete")
-        act_dup   = menu.addAction("Duplicate")
-        menu.addSeparator()
-        menu.addSection("Change Style")
-        act_oval    = menu.addAction("Oval  — speech bubble")
-        act_cloud   = menu.addAction("Cloud — thought bubble")
-        act_rect    = menu.addAction("Rectangle — caption bar")
-        act_spiky   = menu.addAction("Spiky — shout / explosion")
-        act_text    = menu.addAction("Text only — no bubble")
-        act_scrim   = menu.addAction("Scrim — dark text strip")
-        act_caption = menu.addAction("Caption — stroke text overlay")
-        menu.addSeparator()
-        act_front = menu.addAction("Bring to Front")
-        act_back  = menu.addAction("Send to Back")
-
-        # Snap options per style
-        act_snap_top = act_snap_bot = act_snap_full = None
-        if self._style in ("rect", "scrim"):
+    # Right-click menu: built once and shared by every bubble; each show only
+    # refreshes check marks and which snap actions apply.
+    _ctx_menu: QMenu | None = None
+    _ctx_actions: dict[str, QAction] = {}
+    _CTX_HANDLERS = {
+        **{style: (lambda b, style=style: b.set_style(style)) for style in STYLES},
+        "delete":      lambda b: b._delete(),
+        "duplicate":   lambda b: b._duplicate(),
+        "front":       lambda b: b.setZValue(b.zValue() + 1),
+        "back":        lambda b: b.setZValue(max(0, b.zValue() - 1)),
+        "snap_top":    lambda b: b._snap_to_edge("top"),
+        "snap_bottom": lambda b: b._snap_to_edge("bottom"),
+        "snap_full":   lambda b: b._snap_to_scrim(),
+    }
+
+    @classmethod
+    def _context_menu(cls) -> QMenu:
+        if cls._ctx_menu is None:
+            menu = QMenu()
+            actions: dict[str, QAction] = {}
+
+            def add(key: str, text: str) -> QAction:
+                act = menu.addAction(text)
+                act.setData(key)
+                actions[key] = act
+                return act
+
+            add("delete",    "Delete")
+            add("duplicate", "Duplicate")
+            menu.addSeparator()
+            menu.addSection("Change Style")
+            for style, text in _STYLE_MENU:
+                add(style, text).setCheckable(True)
             menu.addSeparator()
-            act_snap_top  = menu.addAction("Snap to Top Edge")
-            act_snap_bot  = menu.addAction("Snap to Bottom Edge")
-        if self._style == "scrim":
-            act_snap_full = menu.addAction("Snap to Full Width")
+            add("front", "Bring to Front")
+            add("back",  "Send to Back")
+            # Snap options per style (shown only for rect / scrim)
+            actions["snap_sep"] = menu.addSeparator()
+            add("snap_top",    "Snap to Top Edge")
+            add("snap_bottom", "Snap to Bottom Edge")
+            add("snap_full",   "Snap to Full Width")
+            cls._ctx_menu, cls._ctx_actions = menu, actions
+        return cls._ctx_menu
 
+    def contextMenuEvent(self, event: QGraphicsSceneContextMenuEvent):
+        menu    = self._context_menu()
+        actions = self._ctx_actions
         # Mark current style
-        for act, s in [(act_oval,"oval"),(act_cloud,"cloud"),
-                       (act_rect,"rect"),(act_spiky,"spiky"),
-                       (act_text,"text"),(act_scrim,"scrim"),
-                       (act_caption,"caption")]:
-            act.setCheckable(True)
-            act.setChecked(self._style == s)
-
-        chosen = menu.exec(event.screenPos())
-        if   chosen == act_del:     self._delete()
-        elif chosen == act_dup:     self._duplicate()
-        elif chosen == act_oval:    self.set_style("oval")
-        elif chosen == act_cloud:   self.set_style("cloud")
-        elif chosen == act_rect:    self.set_style("rect")
-        elif chosen == act_spiky:   self.set_style("spiky")
-        elif chosen == act_text:    self.set_style("text")
-        elif chosen == act_scrim:   self.set_style("scrim")
-        elif chosen == act_caption: self.set_style("caption")
-        elif chosen == act_front: self.setZValue(self.zValue() + 1)
-        elif chosen == act_back:  self.setZValue(max(0, self.zValue() - 1))
-        elif act_snap_top  and chosen == act_snap_top:  self._snap_to_edge("top")
-        elif act_snap_bot  and chosen == act_snap_bot:  self._snap_to_edge("bottom")
-        elif act_snap_full and chosen == act_snap_full: self._snap_to_scrim()
+        for style in STYLES:
+            actions[style].setChecked(self._style == style)
+        snap_edges = self._style in ("rect", "scrim")
+        for key in ("snap_sep", "snap_top", "snap_bottom"):
+            actions[key].setVisible(snap_edges)
+        actions["snap_full"].setVisible(self._style == "scrim")
+
+        chosen  = menu.exec(event.screenPos())
+        handler = self._CTX_HANDLERS.get(chosen.data()) if chosen else None
+        if handler:
+            handler(self)
 
     def _delete(self):
         if not self.scene():
             return
         stack = self._undo_stack()
         if stack:
-            from undo_commands import DeleteBubbleCommand
             stack.push(DeleteBubbleCommand(self.scene(), self))
         else:
             self.scene().removeItem(self)
@@ -1284,7 +1749,6 @@ class BubbleItem(QGraphicsItem):
             nb._text_item.setVisible(False)
         stack = self._undo_stack()
         if stack:
-            from undo_commands import AddBubbleCommand
             stack.push(AddBubbleCommand(self.scene(), nb))
         else:
             self.scene().addItem(nb)
@@ -6,14 +6,19 @@ Dual mode shows two media items side by side.
 ZoomBar lives below the view.
 """
 
+import os
+import re
+
 from PyQt6.QtWidgets import (
     QGraphicsScene, QGraphicsView, QGraphicsItem, QGraphicsTextItem,
     QWidget, QHBoxLayout, QLabel, QPushButton, QSlider,
 )
-from PyQt6.QtCore import Qt, QRectF, QPointF, QEvent, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import (
+    Qt, QRect, QRectF, QPoint, QPointF, QEvent, QThread, QTimer, pyqtSignal, pyqtSlot,
+)
 from PyQt6.QtGui import (
     QPixmap, QPainter, QColor, QUndoStack, QFont, QPen,
-    QFontMetrics, QTransform, QBrush, QImage,
+    QFontMetrics, QTransform, QBrush, QImage, QSurfaceFormat,
 )
 
 from video_player import VideoPlayer, FrameDecodeWorker
@@ -21,6 +26,14 @@ from media_item import MediaItem
 from constants import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
 
 ALL_MEDIA_EXTENSIONS = IMAGE_EXTENSIONS + VIDEO_EXTENSIONS
+_MEDIA_EXT_RE = re.compile(
+    r"\.(?:" + "|".join(re.escape(e[1:]) for e in ALL_MEDIA_EXTENSIONS) + r")\Z",
+    re.IGNORECASE)
+
+
+def _is_media(path: str) -> bool:
+    """True if *path* has a supported photo / video extension."""
+    return _MEDIA_EXT_RE.search(path) is not None
 
 _BAR_FRACTION  = 0.065  # caption bar height as fraction of photo height
 _DUAL_GAP      = 4      # pixel gap between left and right media (module-level fallback)
@@ -29,6 +42,27 @@ _ZOOM_STEP_OUT = 0.80
 _MIN_SCALE     = 0.05
 _MAX_SCALE     = 10.0
 
+# Opt-in GPU compositing for the canvas (SBE_OPENGL=1).  Off by default:
+# some VMs / ARM64 Windows drivers render a black GL viewport.
+_USE_GL_VIEWPORT = os.environ.get("SBE_OPENGL") == "1"
+
+# Viewport update strategy.  Video frames already dirty most of the canvas,
+# so a single full repaint beats Qt's region bookkeeping; SBE_VIEWPORT_UPDATE
+# ("bounding", "smart" or "minimal") switches it for benchmarking.
+_VIEWPORT_UPDATE_MODES = {
+    "full":     QGraphicsView.ViewportUpdateMode.FullViewportUpdate,
+    "bounding": QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate,
+    "smart":    QGraphicsView.ViewportUpdateMode.SmartViewportUpdate,
+    "minimal":  QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate,
+}
+_VIEWPORT_UPDATE_MODE = _VIEWPORT_UPDATE_MODES.get(
+    os.environ.get("SBE_VIEWPORT_UPDATE", "full").lower(),
+    QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+
+_MEME_TEXT_FLAGS = (int(Qt.AlignmentFlag.AlignHCenter) |
+                    int(Qt.AlignmentFlag.AlignVCenter) |
+                    int(Qt.TextFlag.TextWordWrap))
+
 
 # ---------------------------------------------------------------------------
 # MemeBarItem
@@ -60,9 +94,17 @@ class MemeBarItem(QGraphicsItem):
 
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsFocusable, True)
         self.setZValue(50)
-
-        # Cache for the font-shrink result: (text, rect_w, rect_h) → pixel_size
-        self._font_size_cache: tuple | None = None
+        # Cached as a device pixmap: bubble drags and video frames repaint
+        # the scene constantly, but the bar only changes on edit / resize.
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+        # Shrink-to-fit result (font, upper_text, text_rect) — dropped when
+        # the text or the bar geometry changes, so plain repaints reuse it.
+        self._layout_cache: tuple | None = None
+        # {pixel_size: (QFont, QFontMetrics)} for the shrink-to-fit loop;
+        # the base font never changes, so entries stay valid for the bar's life.
+        self._font_bank: dict[int, tuple[QFont, QFontMetrics]] = {}
+        self._text_item.document().contentsChanged.connect(self._drop_layout_cache)
 
     @property
     def is_editing(self):
@@ -73,6 +115,7 @@ class MemeBarItem(QGraphicsItem):
 
     def start_editing(self):
         self._editing = True
+        self.setCacheMode(QGraphicsItem.CacheMode.NoCache)
         self._center_text_item()
         self._text_item.setVisible(True)
         self._text_item.setTextInteractionFlags(
@@ -91,61 +134,98 @@ class MemeBarItem(QGraphicsItem):
             Qt.TextInteractionFlag.NoTextInteraction)
         self._text_item.clearFocus()
         self._text_item.setVisible(False)
-        self._font_size_cache = None  # text may have changed
+        self._layout_cache = None  # text may have changed
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.update()
 
     def set_geometry(self, x: float, y: float, w: float, h: float):
         """Update position and size, resetting the font-shrink cache."""
+        rect = QRectF(x, y, w, h)
+        if rect == self._rect:
+            return
         self.prepareGeometryChange()
-        self._rect = QRectF(x, y, w, h)
-        self._font_size_cache = None
+        self._rect = rect
+        self._layout_cache = None
         self._text_item.setTextWidth(w - 32)
         self._center_text_item()
         self.update()
 
     def boundingRect(self):
-        return QRectF(self._rect)
+        # _rect is only ever replaced, never mutated in place, and sip copies
+        # the returned value for Qt — so no defensive QRectF copy is needed.
+        return self._rect
 
     def paint(self, painter, option, widget=None):
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Semi-transparent dark scrim — Instagram/Snapchat style
+        # Semi-transparent dark scrim — Instagram/Snapchat style.  An
+        # axis-aligned fill gains nothing from antialiasing, so it stays off
+        # until the text pass.
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         painter.fillRect(self._rect, QColor(0, 0, 0, 205))
 
         if self._editing:
             return
 
-        text      = (self.text() or " ").upper()
-        text_rect = self._rect.adjusted(20, 4, -20, -4)
-        flags     = (int(Qt.AlignmentFlag.AlignHCenter) |
-                     int(Qt.AlignmentFlag.AlignVCenter) |
-                     int(Qt.TextFlag.TextWordWrap))
-
-        # Use cached pixel size if the key matches, else recompute
-        cache_key = (text, text_rect.width(), text_rect.height())
-        if self._font_size_cache and self._font_size_cache[0] == cache_key:
-            font = QFont(self._font)
-            font.setPixelSize(self._font_size_cache[1])
-        else:
-            font   = QFont(self._font)
-            min_px = max(10, font.pixelSize() // 4)
-            while font.pixelSize() > min_px:
-                fm = QFontMetrics(font)
-                if fm.boundingRect(text_rect.toRect(), flags, text).height() \
-                        <= text_rect.height():
-                    break
-                font.setPixelSize(font.pixelSize() - 2)
-            self._font_size_cache = (cache_key, font.pixelSize())
-
+        if self._layout_cache is None:
+            self._layout_cache = self._fit_text()
+        font, text, text_rect = self._layout_cache
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
         painter.setFont(font)
 
         # Subtle drop shadow (1 px offset) instead of heavy 8-direction stroke
         painter.setPen(QPen(QColor(0, 0, 0, 160)))
-        painter.drawText(text_rect.adjusted(1, 1, 1, 1), flags, text)
+        painter.drawText(text_rect.adjusted(1, 1, 1, 1), _MEME_TEXT_FLAGS, text)
 
         # White text on top
         painter.setPen(QPen(QColor(255, 255, 255)))
-        painter.drawText(text_rect, flags, text)
+        painter.drawText(text_rect, _MEME_TEXT_FLAGS, text)
+
+    def _fit_text(self) -> tuple[QFont, str, QRectF]:
+        """Shrink the bar font until the uppercased text fits the bar.
+
+        Candidate sizes step down by 2 px from the base size; the largest one
+        that fits is found by binary search (wrapped height only grows with
+        the font size).  If none above the floor fits, the first size at or
+        below it is used.
+        """
+        text      = (self.text() or " ").upper()
+        text_rect = self._rect.adjusted(20, 4, -20, -4)
+        bounds    = text_rect.toRect()
+        base_px   = self._font.pixelSize()
+        min_px    = max(10, base_px // 4)
+
+        def fits(px: int) -> bool:
+            fm = self._font_for(px)[1]
+            return fm.boundingRect(bounds, _MEME_TEXT_FLAGS, text).height() \
+                <= text_rect.height()
+
+        # Step i is base_px - 2*i; steps 0..n-1 lie above the floor.
+        n = len(range(base_px, min_px, -2))
+        lo, hi = 0, n
+        if n:
+            if fits(base_px):     # common case: the full size fits
+                hi = 0
+            else:
+                lo = 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if fits(base_px - 2 * mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return self._font_for(base_px - 2 * lo)[0], text, text_rect
+
+    def _font_for(self, px: int) -> tuple[QFont, QFontMetrics]:
+        """Return the bar font and its metrics at pixel size *px* (memoised)."""
+        entry = self._font_bank.get(px)
+        if entry is None:
+            font = QFont(self._font)
+            font.setPixelSize(px)
+            entry = self._font_bank[px] = (font, QFontMetrics(font))
+        return entry
+
+    def _drop_layout_cache(self):
+        self._layout_cache = None
 
     def mouseDoubleClickEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -176,12 +256,14 @@ class RightMediaPlaceholder(QGraphicsItem):
         self.setZValue(-0.9)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, False)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsFocusable, False)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
     def boundingRect(self):
-        return QRectF(self._rect)
+        return self._rect
 
     def paint(self, painter, option, widget=None):
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Fill and dashed frame are axis-aligned: draw them without AA.
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         painter.fillRect(self._rect, QColor("#0f1319"))
 
         pen = QPen(QColor("#3a4d66"))
@@ -190,6 +272,8 @@ class RightMediaPlaceholder(QGraphicsItem):
         painter.setPen(pen)
         painter.drawRect(self._rect.adjusted(12, 12, -12, -12))
 
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
         font = QFont()
         font.setPixelSize(max(14, int(self._rect.height() * 0.035)))
         painter.setFont(font)
@@ -233,8 +317,11 @@ class DualSeamItem(QGraphicsItem):
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsFocusable,  False)
 
     def set_geometry(self, x, y, w, h):
+        rect = QRectF(x, y, max(0.0, float(w)), float(h))
+        if rect == self._rect:
+            return
         self.prepareGeometryChange()
-        self._rect = QRectF(x, y, max(0.0, float(w)), float(h))
+        self._rect = rect
         self.update()
 
     def set_gap_color(self, color: QColor):
@@ -251,7 +338,7 @@ class DualSeamItem(QGraphicsItem):
         self.update()
 
     def boundingRect(self):
-        return QRectF(self._rect)
+        return self._rect
 
     def paint(self, painter, option, widget=None):
         if self._rect.width() <= 0:
@@ -303,6 +390,9 @@ class PhotoScene(QGraphicsScene):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # A handful of items (media, bubbles, bars): a linear scan beats
+        # rebuilding the BSP tree on every layout / scene-rect change.
+        self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self._photo_item:        MediaItem | None = None
         self._photo_item_right:  MediaItem | None = None
         self._right_placeholder: RightMediaPlaceholder | None = None
@@ -318,12 +408,25 @@ class PhotoScene(QGraphicsScene):
         # late-arriving results from old videos are silently discarded.
         self._decode_gen_left  = 0
         self._decode_gen_right = 0
+        # Latest frame index asked for per side; worker results for any other
+        # index are cached but not shown, so a late decode can't rewind a scrub.
+        self._want_left  = -1
+        self._want_right = -1
+        # Scrub requests are coalesced to one per event-loop pass: only the
+        # newest index per side survives until _flush_frame_updates runs.
+        self._pending_frame:       int | None = None
+        self._pending_right_frame: int | None = None
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(0)
+        self._frame_timer.timeout.connect(self._flush_frame_updates)
 
         self.undo_stack  = QUndoStack(self)
         self._meme_top:  MemeBarItem | None = None
         self._meme_bot:  MemeBarItem | None = None
         self._dual_mode  = False
         self._fitting    = False   # re-entrancy guard for fit_scene_to_media
+        self._primary_view: QGraphicsView | None = None   # set by PhotoView
 
         self._overlay_layers: list = []            # list[MediaItem]
         self._dual_gap = _DUAL_GAP                 # instance copy of gap
@@ -357,6 +460,7 @@ class PhotoScene(QGraphicsScene):
         self._reset_all()
         self._video_player = player
         self._photo_item = MediaItem(first)
+        self._photo_item.set_video_frames(True)  # per-frame: NoCache, no pre-scale
         self._photo_item.setPos(0, 0)
         self.addItem(self._photo_item)
         self.setSceneRect(QRectF(0, 0, float(player.width), float(player.height)))
@@ -443,18 +547,22 @@ class PhotoScene(QGraphicsScene):
     @pyqtSlot(int, int, QImage)
     def _on_left_frame_ready(self, gen: int, frame_idx: int, image: QImage):
         """Called on the UI thread when the left decode worker finishes a frame."""
-        if gen != self._decode_gen_left:
+        if gen != self._decode_gen_left or self._video_player is None:
             return  # stale result from a previous video — discard
-        if self._photo_item is not None:
-            self._photo_item.set_pixmap(QPixmap.fromImage(image))
+        pixmap = QPixmap.fromImage(image)
+        self._video_player.store_frame_pixmap(frame_idx, pixmap)
+        if self._photo_item is not None and frame_idx == self._want_left:
+            self._photo_item.set_pixmap(pixmap)
 
     @pyqtSlot(int, int, QImage)
     def _on_right_frame_ready(self, gen: int, frame_idx: int, image: QImage):
         """Called on the UI thread when the right decode worker finishes a frame."""
-        if gen != self._decode_gen_right:
+        if gen != self._decode_gen_right or self._video_player_right is None:
             return
-        if self._photo_item_right is not None:
-            self._photo_item_right.set_pixmap(QPixmap.fromImage(image))
+        pixmap = QPixmap.fromImage(image)
+        self._video_player_right.store_frame_pixmap(frame_idx, pixmap)
+        if self._photo_item_right is not None and frame_idx == self._want_right:
+            self._photo_item_right.set_pixmap(pixmap)
 
     # ------------------------------------------------------------------
     # Video frame update (called from MainWindow when scrubber moves)
@@ -462,9 +570,31 @@ class PhotoScene(QGraphicsScene):
 
     def update_frame(self, frame_idx: int):
         """Request async refresh of the background pixmap(s) to the given video frame."""
+        self._pending_frame = frame_idx
+        self._pending_right_frame = frame_idx
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def update_right_frame(self, frame_idx: int):
+        """Async update of only the right media frame (independent right-player scrubbing)."""
+        self._pending_right_frame = frame_idx
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def _flush_frame_updates(self):
+        """Apply the newest pending frame index for each side."""
+        left, right = self._pending_frame, self._pending_right_frame
+        self._pending_frame = self._pending_right_frame = None
+        if left is not None:
+            self._show_frame(left)
+        if right is not None:
+            self._show_right_frame(right)
+
+    def _show_frame(self, frame_idx: int):
+        """Push *frame_idx* to the left media and any video overlay layers."""
         if self._video_player is not None and self._photo_item is not None:
-            if self._decode_worker is not None:
-                self._decode_worker.request(frame_idx)
+            self._want_left = self._request_frame(
+                self._video_player, self._decode_worker, self._photo_item, frame_idx)
 
         for item in self._overlay_layers:
             player = item.video_player() if hasattr(item, "video_player") else None
@@ -474,21 +604,31 @@ class PhotoScene(QGraphicsScene):
                 if pix is not None:
                     item.set_pixmap(pix)
 
+    def _show_right_frame(self, frame_idx: int):
+        """Push *frame_idx* to the right media in dual mode."""
         if self._dual_mode and self._video_player_right is not None \
                 and self._photo_item_right is not None:
             right_idx = min(frame_idx,
                             self._video_player_right.frame_count - 1)
-            if self._decode_worker_right is not None:
-                self._decode_worker_right.request(right_idx)
+            self._want_right = self._request_frame(
+                self._video_player_right, self._decode_worker_right,
+                self._photo_item_right, right_idx)
 
-    def update_right_frame(self, frame_idx: int):
-        """Async update of only the right media frame (independent right-player scrubbing)."""
-        if self._dual_mode and self._video_player_right is not None \
-                and self._photo_item_right is not None:
-            right_idx = min(frame_idx,
-                            self._video_player_right.frame_count - 1)
-            if self._decode_worker_right is not None:
-                self._decode_worker_right.request(right_idx)
+    @staticmethod
+    def _request_frame(player: VideoPlayer, worker: FrameDecodeWorker | None,
+                       item: MediaItem, frame_idx: int) -> int:
+        """
+        Show *frame_idx* straight from the player's pixmap cache when it has
+        it, otherwise hand it to the decode worker.  Returns the (clamped)
+        index so the caller can record it as the side's wanted frame.
+        """
+        frame_idx = max(0, min(frame_idx, player.frame_count - 1))
+        pixmap = player.cached_frame_pixmap(frame_idx)
+        if pixmap is not None:
+            item.set_pixmap(pixmap)
+        elif worker is not None:
+            worker.request(frame_idx)
+        return frame_idx
 
     def pause_decode_workers(self):
         """
@@ -528,15 +668,21 @@ class PhotoScene(QGraphicsScene):
         self.addItem(self._meme_top)
         self.addItem(self._meme_bot)
 
-    def _update_meme_bar_layout(self):
+    def _update_meme_bar_layout(self, media_rect: QRectF | None = None):
         """Resize meme bars to span the current canvas width.
 
         Call this after any operation that changes the canvas dimensions
         (fit_scene_to_media, _install_right_media, disable_dual_mode).
+
+        *media_rect* is the bar-less canvas rect when the caller has just
+        computed it (defaults to the current scene rect); the scene rect is
+        then set once with the bars already included.
         """
         if self._meme_top is None or not self.has_photo():
+            if media_rect is not None:
+                self._set_scene_rect_if_changed(media_rect)
             return
-        sr    = self.sceneRect()
+        sr    = media_rect if media_rect is not None else self.sceneRect()
         w     = sr.width()
         px    = self._photo_item.pos().x()
         py    = self._photo_item.pos().y()
@@ -545,11 +691,16 @@ class PhotoScene(QGraphicsScene):
         top_y = py - bar_h
         bot_y = py + ph
         # Expand scene rect vertically to include bars
-        self.setSceneRect(QRectF(sr.x(), top_y, w, ph + 2 * bar_h))
+        self._set_scene_rect_if_changed(QRectF(sr.x(), top_y, w, ph + 2 * bar_h))
         # Update each bar's geometry in place (preserves editing state and text)
         for bar, y in ((self._meme_top, top_y), (self._meme_bot, bot_y)):
             bar.set_geometry(sr.x(), y, w, bar_h)
 
+    def _set_scene_rect_if_changed(self, rect: QRectF):
+        """setSceneRect, skipped when the rect is already exactly *rect*."""
+        if self.sceneRect() != rect:
+            self.setSceneRect(rect)
+
     def disable_meme_mode(self):
         self._remove_meme_bars()
         if self.has_photo():
@@ -652,7 +803,10 @@ class PhotoScene(QGraphicsScene):
         self._video_player_right = player
         self._decode_gen_right, self._decode_worker_right, self._decode_thread_right = \
             self._start_decode_worker(player, self._on_right_frame_ready)
-        return self._install_right_media(first)
+        if not self._install_right_media(first):
+            return False
+        self._photo_item_right.set_video_frames(True)  # per-frame: NoCache, no pre-scale
+        return True
 
     def _install_right_media(self, pixmap: QPixmap) -> bool:
         """
@@ -885,14 +1039,14 @@ class PhotoScene(QGraphicsScene):
                 total_w = lx + lw
                 total_h = ly + lh
 
-            self.setSceneRect(QRectF(lx, ly, total_w - lx, total_h - ly))
-
             # Update seam position if dual seam is active
             if self._dual_seam and self._dual_mode:
                 self._dual_seam.set_geometry(lx + lw, ly, self._dual_gap, lh)
 
-            # Keep meme bars spanning the full canvas if meme mode is active
-            self._update_meme_bar_layout()
+            # Set the scene rect, keeping meme bars spanning the full canvas
+            # if meme mode is active, in a single pass.
+            self._update_meme_bar_layout(
+                QRectF(lx, ly, total_w - lx, total_h - ly))
         finally:
             self._fitting = False
 
@@ -931,7 +1085,8 @@ class PhotoScene(QGraphicsScene):
 
     def mouseDoubleClickEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            t = self.views()[0].transform() if self.views() else QTransform()
+            t = (self._primary_view.transform() if self._primary_view is not None
+                 else QTransform())
             item = self.itemAt(event.scenePos(), t)
             # MediaItem and its resize handle children are background
             is_bg = (item is None or
@@ -968,12 +1123,62 @@ class PhotoView(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setDragMode(QGraphicsView.DragMode.NoDrag)
         self.setAcceptDrops(True)
+        self._apply_update_mode(_VIEWPORT_UPDATE_MODE)
+        if _USE_GL_VIEWPORT:
+            self._install_gl_viewport()
         self._photo_scene   = scene
+        scene._primary_view = self
         self._fit_to_window = True
+        self._drag_accepted = False   # decided once per drag in dragEnterEvent
+        self._last_emitted_percent = -1
+        self._wheel_accum = 0         # angleDelta not yet turned into zoom steps
+        self._welcome_cache: tuple | None = None   # ((size, dpr), QPixmap)
         self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
         # Set background brush using palette-aware logic
         self._update_background_brush()
 
+    def set_playback_mode(self, playing: bool):
+        """
+        Pick the viewport update strategy for the current interaction.
+
+        During playback only the video frame changes, so MinimalViewportUpdate
+        confines repaints to the media item's region; editing goes back to
+        the default (FullViewportUpdate unless overridden).  GL viewports
+        always repaint whole frames and are left alone.
+        """
+        if _USE_GL_VIEWPORT:
+            return
+        self._apply_update_mode(
+            QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate if playing
+            else _VIEWPORT_UPDATE_MODE)
+
+    def _apply_update_mode(self, mode):
+        self.setViewportUpdateMode(mode)
+        # Whole-viewport repaints make the 2 px AA margin on dirty rects moot;
+        # partial modes need it to avoid leaving antialiased edges behind.
+        self.setOptimizationFlag(
+            QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing,
+            mode == QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+
+    def _install_gl_viewport(self):
+        """Composite the scene on the GPU via a multisampled QOpenGLWidget.
+
+        GL viewports repaint whole frames, so partial-update bookkeeping is
+        switched off.  Falls back silently to the raster viewport when the
+        QtOpenGLWidgets module is unavailable.
+        """
+        try:
+            from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+        except ImportError:
+            return
+        fmt = QSurfaceFormat()
+        fmt.setSamples(4)
+        vp = QOpenGLWidget()
+        vp.setFormat(fmt)
+        self.setViewport(vp)
+        self.setViewportUpdateMode(
+            QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+
     def _update_background_brush(self):
         """Keep the empty canvas aligned with the fixed v4 dark theme."""
         self.setBackgroundBrush(QColor("#0f1319"))
@@ -988,7 +1193,7 @@ class PhotoView(QGraphicsView):
             self.fitInView(self._photo_scene.sceneRect(),
                            Qt.AspectRatioMode.KeepAspectRatio)
             self._fit_to_window = True
-            self.zoom_changed.emit(self._zoom_percent())
+            self._emit_zoom(self._zoom_percent())
 
     def fit_width(self):
         if not self._photo_scene.has_photo():
@@ -999,12 +1204,12 @@ class PhotoView(QGraphicsView):
             self.resetTransform()
             self.scale(vw / sw, vw / sw)
             self._fit_to_window = False
-            self.zoom_changed.emit(self._zoom_percent())
+            self._emit_zoom(self._zoom_percent())
 
     def zoom_100(self):
         self.resetTransform()
         self._fit_to_window = False
-        self.zoom_changed.emit(100)
+        self._emit_zoom(100)
 
     def zoom_in(self):
         cur = self._current_scale()
@@ -1013,7 +1218,7 @@ class PhotoView(QGraphicsView):
         self.scale(min(_ZOOM_STEP_IN, _MAX_SCALE / cur),
                    min(_ZOOM_STEP_IN, _MAX_SCALE / cur))
         self._fit_to_window = False
-        self.zoom_changed.emit(self._zoom_percent())
+        self._emit_zoom(self._zoom_percent())
 
     def zoom_out(self):
         cur = self._current_scale()
@@ -1022,7 +1227,7 @@ class PhotoView(QGraphicsView):
         self.scale(max(_ZOOM_STEP_OUT, _MIN_SCALE / cur),
                    max(_ZOOM_STEP_OUT, _MIN_SCALE / cur))
         self._fit_to_window = False
-        self.zoom_changed.emit(self._zoom_percent())
+        self._emit_zoom(self._zoom_percent())
 
     def set_zoom_percent(self, percent: int):
         """Set an absolute zoom level (e.g. 100 = 1:1)."""
@@ -1031,7 +1236,13 @@ class PhotoView(QGraphicsView):
         self.resetTransform()
         self.scale(target, target)
         self._fit_to_window = False
-        self.zoom_changed.emit(self._zoom_percent())
+        self._emit_zoom(self._zoom_percent())
+
+    def _emit_zoom(self, percent: int):
+        """Emit zoom_changed only when the displayed percentage changes."""
+        if percent != self._last_emitted_percent:
+            self._last_emitted_percent = percent
+            self.zoom_changed.emit(percent)
 
     def _current_scale(self):
         return self.transform().m11()
@@ -1040,61 +1251,84 @@ class PhotoView(QGraphicsView):
         return max(1, int(round(self._current_scale() * 100)))
 
     def drawBackground(self, painter, rect):
+        # Plain background fill — no antialiasing needed for it.
+        aa = painter.testRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         super().drawBackground(painter, rect)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, aa)
         if not self._photo_scene.has_photo():
-            # Welcome screen — draw in viewport coordinates so it's always centered
-            icon_bg_color     = QColor("#1e2535")
-            icon_border_color = QColor("#3a4d66")
-            icon_plus_color   = QColor("#8a95aa")
-            main_text_color   = QColor("#e8ecf4")
-            sub_text_color    = QColor("#8a95aa")
-
+            # Welcome screen — drawn in viewport coordinates so it's always
+            # centered; rendered once per viewport size and blitted after.
             painter.save()
             painter.resetTransform()
-            vr = self.viewport().rect()
-
-            # Icon area
-            icon_size = 64
-            ix = vr.center().x() - icon_size // 2
-            iy = vr.center().y() - icon_size // 2 - 40
-            painter.setBrush(QBrush(icon_bg_color))
-            painter.setPen(QPen(icon_border_color, 2))
-            painter.drawRoundedRect(ix, iy, icon_size, icon_size, 12, 12)
-            painter.setPen(QPen(icon_plus_color, 3))
-            painter.setFont(QFont("sans-serif", 28))
-            painter.drawText(
-                ix, iy, icon_size, icon_size,
-                int(Qt.AlignmentFlag.AlignCenter), "+"
-            )
-
-            # Main message
-            painter.setPen(QPen(main_text_color))
-            f1 = QFont()
-            f1.setPixelSize(18)
-            f1.setBold(True)
-            painter.setFont(f1)
-            painter.drawText(
-                vr.left(), iy + icon_size + 18, vr.width(), 28,
-                int(Qt.AlignmentFlag.AlignHCenter), "Open a photo or video to get started"
-            )
-
-            # Sub-message
-            painter.setPen(QPen(sub_text_color))
-            f2 = QFont()
-            f2.setPixelSize(13)
-            painter.setFont(f2)
-            painter.drawText(
-                vr.left(), iy + icon_size + 52, vr.width(), 22,
-                int(Qt.AlignmentFlag.AlignHCenter),
-                "Click anywhere here, drag & drop a file, or use  Open  above"
-            )
-            painter.drawText(
-                vr.left(), iy + icon_size + 74, vr.width(), 22,
-                int(Qt.AlignmentFlag.AlignHCenter),
-                "Then double-click the canvas or use  + Bubble  to add speech bubbles"
-            )
+            painter.drawPixmap(0, 0, self._welcome_pixmap())
             painter.restore()
 
+    def _welcome_pixmap(self) -> QPixmap:
+        """Return the welcome-screen overlay for the current viewport size."""
+        size = self.viewport().size()
+        dpr  = self.viewport().devicePixelRatioF()
+        if self._welcome_cache is None or self._welcome_cache[0] != (size, dpr):
+            pm = QPixmap(size * dpr)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pm)
+            self._paint_welcome(painter, QRect(QPoint(0, 0), size))
+            painter.end()
+            self._welcome_cache = ((size, dpr), pm)
+        return self._welcome_cache[1]
+
+    @staticmethod
+    def _paint_welcome(painter: QPainter, vr: QRect):
+        """Draw the "+" icon and the getting-started text centred in *vr*."""
+        icon_bg_color     = QColor("#1e2535")
+        icon_border_color = QColor("#3a4d66")
+        icon_plus_color   = QColor("#8a95aa")
+        main_text_color   = QColor("#e8ecf4")
+        sub_text_color    = QColor("#8a95aa")
+
+        # Icon area — rounded, so this is the one shape that wants AA
+        icon_size = 64
+        ix = vr.center().x() - icon_size // 2
+        iy = vr.center().y() - icon_size // 2 - 40
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QBrush(icon_bg_color))
+        painter.setPen(QPen(icon_border_color, 2))
+        painter.drawRoundedRect(ix, iy, icon_size, icon_size, 12, 12)
+        painter.setPen(QPen(icon_plus_color, 3))
+        painter.setFont(QFont("sans-serif", 28))
+        painter.drawText(
+            ix, iy, icon_size, icon_size,
+            int(Qt.AlignmentFlag.AlignCenter), "+"
+        )
+
+        # Main message
+        painter.setPen(QPen(main_text_color))
+        f1 = QFont()
+        f1.setPixelSize(18)
+        f1.setBold(True)
+        painter.setFont(f1)
+        painter.drawText(
+            vr.left(), iy + icon_size + 18, vr.width(), 28,
+            int(Qt.AlignmentFlag.AlignHCenter), "Open a photo or video to get started"
+        )
+
+        # Sub-message
+        painter.setPen(QPen(sub_text_color))
+        f2 = QFont()
+        f2.setPixelSize(13)
+        painter.setFont(f2)
+        painter.drawText(
+            vr.left(), iy + icon_size + 52, vr.width(), 22,
+            int(Qt.AlignmentFlag.AlignHCenter),
+            "Click anywhere here, drag & drop a file, or use  Open  above"
+        )
+        painter.drawText(
+            vr.left(), iy + icon_size + 74, vr.width(), 22,
+            int(Qt.AlignmentFlag.AlignHCenter),
+            "Then double-click the canvas or use  + Bubble  to add speech bubbles"
+        )
+
     def mousePressEvent(self, event):
         # When no media is loaded the canvas acts as a giant "open" button.
         if (event.button() == Qt.MouseButton.LeftButton
@@ -1106,6 +1340,7 @@ class PhotoView(QGraphicsView):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self._welcome_cache = None
         if self._fit_to_window:
             self.fit_photo()
 
@@ -1113,29 +1348,39 @@ class PhotoView(QGraphicsView):
         if not self._photo_scene.has_photo():
             event.ignore()
             return
-        if event.angleDelta().y() > 0:
+        # High-resolution wheels / trackpads send fractions of a detent;
+        # accumulate them and zoom one step per 120 units (one notch).
+        dy = event.angleDelta().y()
+        if (dy > 0) != (self._wheel_accum > 0):
+            self._wheel_accum = 0     # direction reversed — drop the remainder
+        self._wheel_accum += dy
+        while self._wheel_accum >= 120:
+            self._wheel_accum -= 120
             self.zoom_in()
-        else:
+        while self._wheel_accum <= -120:
+            self._wheel_accum += 120
             self.zoom_out()
         event.accept()
 
     def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith(ALL_MEDIA_EXTENSIONS):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
+        # The dragged URLs can't change mid-drag, so dragMoveEvent reuses
+        # this decision instead of re-checking every URL on every move.
+        self._drag_accepted = event.mimeData().hasUrls() and any(
+            _is_media(url.toLocalFile()) for url in event.mimeData().urls())
+        if self._drag_accepted:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
 
     def dragMoveEvent(self, event):
-        event.acceptProposedAction() if event.mimeData().hasUrls() \
+        event.acceptProposedAction() if self._drag_accepted \
             else event.ignore()
 
     def dropEvent(self, event):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 path = url.toLocalFile()
-                if path.lower().endswith(ALL_MEDIA_EXTENSIONS):
+                if _is_media(path):
                     if (self._photo_scene.is_dual_mode() and
                             self._photo_scene.has_photo()):
                         sp = self.mapToScene(event.position().toPoint())
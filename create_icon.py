@@ -7,6 +7,8 @@ Run once before building:
 Outputs:
     icons/icon.png   (256 × 256, used by Linux desktop entry)
     icons/icon.ico   (multi-size ICO for Windows exe)
+    icons/LongWeekendLabs.logo.200.png     (About dialog logo, 1x)
+    icons/LongWeekendLabs.logo.200@2x.png  (About dialog logo, 2x)
 """
 
 import os
@@ -18,6 +20,9 @@ TAIL_COLOUR = (255, 255, 255)
 
 SIZES = [16, 32, 48, 64, 128, 256, 512]
 
+# Width the About dialog shows the company logo at (logical pixels)
+ABOUT_LOGO_WIDTH = 200
+
 
 def _draw_bubble(draw: ImageDraw.ImageDraw, size: int):
     """Draw a white speech bubble centred on a (size × size) canvas."""
@@ -61,14 +66,29 @@ def make_icon(size: int) -> Image.Image:
     return img
 
 
+def make_about_logos(icons_dir: str):
+    """Pre-scale the company logo so the About dialog never resamples it."""
+    src = Image.open(os.path.join(icons_dir, "LongWeekendLabs.logo.jpg")).convert("RGB")
+    for scale, suffix in ((1, ""), (2, "@2x")):
+        w = ABOUT_LOGO_WIDTH * scale
+        h = round(src.height * w / src.width)
+        src.resize((w, h), Image.Resampling.LANCZOS).save(
+            os.path.join(icons_dir, f"LongWeekendLabs.logo.{ABOUT_LOGO_WIDTH}{suffix}.png"),
+            optimize=True,
+        )
+
+
 def main():
     here      = os.path.dirname(os.path.abspath(__file__))
     icons_dir = os.path.join(here, "icons")
     os.makedirs(icons_dir, exist_ok=True)
 
+    # Draw once at the largest size and Lanczos-downsample the rest — ImageDraw
+    # doesn't antialias, so the small sizes come out smoother this way too.
+    big    = make_icon(max(SIZES))
     images = {}
     for s in SIZES:
-        images[s] = make_icon(s)
+        images[s] = big if s == big.width else big.resize((s, s), Image.Resampling.LANCZOS)
         images[s].save(os.path.join(icons_dir, f"icon_{s}.png"))
 
     # Main PNG (256 px)
@@ -81,6 +101,8 @@ def main():
         sizes=[(s, s) for s in SIZES],
     )
 
+    make_about_logos(icons_dir)
+
     print(f"Icons written to: {icons_dir}")
     for name in ("icon.png", "icon.ico"):
         print(f"  {name}")
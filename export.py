@@ -6,18 +6,23 @@ Video export:  renders each export frame with bubbles via OpenCV, then
                muxes original audio back in with FFmpeg (if available).
 """
 
+import functools
 import os
 import shutil
 import subprocess
 import sys
+import tempfile
 from datetime import datetime
 
-from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtCore import Qt, QElapsedTimer, QRectF
 from PyQt6.QtGui import QImage, QPainter, QPixmap
 from PyQt6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog, QApplication
 
 from video_player import VideoPlayer
 
+# Minimum time between progress-dialog refreshes during video export
+_PROGRESS_INTERVAL_MS = 50
+
 
 def _find_ffmpeg() -> str | None:
     """Return path to FFmpeg: bundled copy first, then system PATH."""
@@ -156,9 +161,50 @@ def export_video(parent, scene, photo_item, player: VideoPlayer,
         return
 
 
-def _prerender_bubble_overlay(scene, photo_item, W: int, H: int):
+class _BubbleOverlay:
+    """
+    Pre-rendered bubble layer, split once for the per-frame blend.
+
+    Only the bounding box of the non-transparent pixels is kept:
+        bbox  — (y0, y1, x0, x1) in frame coordinates, or None if empty
+        inv   — 255 − alpha inside the box, uint16, repeated over BGR
+        term  — premultiplied overlay BGR × 255 inside the box, uint16
+                (= straight BGR × alpha, so the blend is a plain "over")
+    so each frame only touches the pixels the bubbles actually cover.
+    A uint16 scratch buffer of the box's size is reused by _composite so
+    the blend allocates nothing per frame.
+    """
+
+    __slots__ = ("bbox", "inv", "term", "_acc")
+
+    @property
+    def empty(self) -> bool:
+        """True when no bubble pixel is visible — frames pass through as-is."""
+        return self.bbox is None
+
+    def __init__(self, bgra):
+        """*bgra* is the premultiplied H × W × 4 render (QImage byte order)."""
+        import numpy as np
+        alpha = bgra[:, :, 3]
+        rows  = np.flatnonzero(alpha.any(axis=1))
+        if rows.size == 0:
+            self.bbox = None
+            self.inv  = self.term = self._acc = None
+            return
+        cols = np.flatnonzero(alpha.any(axis=0))
+        y0, y1 = int(rows[0]), int(rows[-1]) + 1
+        x0, x1 = int(cols[0]), int(cols[-1]) + 1
+        self.bbox = (y0, y1, x0, x1)
+        roi = bgra[y0:y1, x0:x1]
+        # cv2 wants matching channel counts, so alpha is repeated over BGR.
+        self.inv  = np.repeat(255 - roi[:, :, 3:4].astype(np.uint16), 3, axis=2)
+        self.term = roi[:, :, :3].astype(np.uint16) * 255
+        self._acc = np.empty_like(self.term)
+
+
+def _prerender_bubble_overlay(scene, photo_item, W: int, H: int) -> _BubbleOverlay:
     """
-    Render the bubble layer ONCE to a BGRA numpy array (H × W × 4, BGRA order).
+    Render the bubble layer ONCE and split it into a _BubbleOverlay.
 
     Bubbles are static — they don't change between video frames — so we render
     them a single time and reuse the result for every frame instead of calling
@@ -177,23 +223,69 @@ def _prerender_bubble_overlay(scene, photo_item, W: int, H: int):
 
     photo_item.setVisible(True)
 
-    overlay = overlay.convertToFormat(QImage.Format.Format_ARGB32)
-    ptr = overlay.bits()
+    # Stay premultiplied: the "over" blend wants exactly that, so there is
+    # no need for a straight-alpha conversion (a full W × H × 4 copy).
+    # No .copy(): _BubbleOverlay only keeps arrays derived from the box, and
+    # `overlay` outlives the constructor call.
+    ptr = overlay.constBits()     # read-only: never detaches the image
     ptr.setsize(H * W * 4)
-    return np.frombuffer(ptr, dtype=np.uint8).reshape((H, W, 4)).copy()
+    return _BubbleOverlay(np.frombuffer(ptr, dtype=np.uint8).reshape((H, W, 4)))
 
 
-def _composite(frame_bgr, overlay_bgra):
-    """Alpha-composite a pre-rendered bubble overlay onto a BGR video frame."""
+def _composite(frame_bgr, overlay: _BubbleOverlay, out=None):
+    """
+    Alpha-composite a pre-rendered bubble overlay onto a BGR video frame.
+
+    Blends in uint16 fixed point — (frame·(255−a) + overlay·a) / 255, rounded —
+    and only inside the overlay's bounding box, using OpenCV's SIMD kernels
+    with dst= pointing at the box (cv2 writes through the strided view).
+    The result goes to *out* (a preallocated H × W × 3 uint8 buffer reused
+    across frames) or a new array; the input may be a cached decoder frame
+    and is left untouched.
+    """
     import numpy as np
-    alpha       = overlay_bgra[:, :, 3:4] / 255.0
-    overlay_bgr = overlay_bgra[:, :, :3].astype(np.float32)
-    base_bgr    = frame_bgr.astype(np.float32)
-    return (base_bgr * (1 - alpha) + overlay_bgr * alpha).clip(0, 255).astype(np.uint8)
+    if out is None:
+        out = frame_bgr.copy()
+    else:
+        np.copyto(out, frame_bgr)
+    return _blend_in_place(out, overlay)
 
 
-def _export_single_video(parent, scene, photo_item, player: VideoPlayer, out_path: str):
+def _blend_in_place(buf, overlay: _BubbleOverlay):
+    """
+    The blend step of _composite, applied directly to *buf* (which must be a
+    buffer we own — never a cached decoder frame).  Returns *buf*.
+    """
+    import cv2
+    if overlay.empty:
+        return buf
+    y0, y1, x0, x1 = overlay.bbox
+    roi = buf[y0:y1, x0:x1]
+    acc = overlay._acc
+    cv2.multiply(roi, overlay.inv, dst=acc, dtype=cv2.CV_16U)
+    cv2.add(acc, overlay.term, dst=acc)       # ≤ 255·255, no saturation
+    cv2.convertScaleAbs(acc, dst=roi, alpha=1 / 255)
+    return buf
+
+
+def _fit_frame(frame, overlay: _BubbleOverlay, out):
+    """
+    Bring a decoded frame to out's size and blend the overlay on top.
+
+    A frame that needs resizing is resized straight into *out* and blended
+    there, so it's touched once; a frame that already fits is passed through
+    untouched when there's nothing to blend.
+    """
     import cv2
+    h, w = out.shape[:2]
+    if frame.shape[0] != h or frame.shape[1] != w:
+        cv2.resize(frame, (w, h), dst=out)
+        return _blend_in_place(out, overlay)
+    return frame if overlay.empty else _composite(frame, overlay, out)
+
+
+def _export_single_video(parent, scene, photo_item, player: VideoPlayer, out_path: str):
+    import numpy as np
     frames = player.get_export_frames()
     if not frames:
         QMessageBox.warning(parent, "Export", "No frames to export after trimming/cuts.")
@@ -203,8 +295,8 @@ def _export_single_video(parent, scene, photo_item, player: VideoPlayer, out_pat
     # Ensure codec-friendly even dimensions.
     W   = player.width
     H   = player.height
-    W   = W if W % 2 == 0 else W + 1
-    H   = H if H % 2 == 0 else H + 1
+    W   = _even(W)
+    H   = _even(H)
     fps = player.playback_fps
 
     # Pause background decode workers so they don't race the export loop.
@@ -218,10 +310,13 @@ def _export_single_video(parent, scene, photo_item, player: VideoPlayer, out_pat
     progress.setWindowModality(Qt.WindowModality.ApplicationModal)
     progress.setMinimumDuration(0)
     progress.setValue(0)
+    clock = QElapsedTimer()
+    clock.start()
 
     tmp_video = out_path + ".tmp_noaudio.mp4"
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    writer = cv2.VideoWriter(tmp_video, fourcc, fps, (W, H))
+    writer, is_h264 = _open_writer(tmp_video, fps, W, H)
+
+    out_frame = np.empty((H, W, 3), dtype=np.uint8)
 
     cancelled = False
     try:
@@ -232,27 +327,152 @@ def _export_single_video(parent, scene, photo_item, player: VideoPlayer, out_pat
 
             frame = player.get_frame_ndarray(frame_idx)
             if frame is not None:
-                if frame.shape[1] != W or frame.shape[0] != H:
-                    frame = cv2.resize(frame, (W, H))
-                writer.write(_composite(frame, bubble_overlay))
+                writer.write(_fit_frame(frame, bubble_overlay, out_frame))
 
-            progress.setValue(i + 1)
-            QApplication.processEvents()
+            _report_progress(progress, i + 1, clock)
+    except _EncodeError:
+        pass    # reported below, once the writer has been released
     finally:
         writer.release()
         progress.close()
         scene.resume_decode_workers()
 
-    if cancelled:
+    if cancelled or _encode_failed(parent, writer):
         _safe_remove(tmp_video)
         return
 
-    _finish_video_audio(player, tmp_video, out_path, frames)
+    _finish_video_audio(player, tmp_video, out_path, frames, is_h264)
     _safe_remove(tmp_video)
 
     QMessageBox.information(parent, "Export", f"Video saved to:\n{out_path}")
 
 
+class _EncodeError(Exception):
+    """The video encoder failed; the message is shown to the user."""
+
+
+class _FFmpegPipeWriter:
+    """
+    cv2.VideoWriter look-alike that streams raw BGR frames to FFmpeg's stdin,
+    which encodes them to H.264 in a single pass — no intermediate mp4v file
+    for FFmpeg to decode again.
+
+    If FFmpeg dies, write() raises _EncodeError and `error` holds the reason;
+    release() also records a non-zero exit status there.
+    """
+
+    def __init__(self, ffmpeg: str, path: str, fps: float, W: int, H: int):
+        cmd = [
+            ffmpeg, "-y", "-nostats", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24",
+            "-s", f"{W}x{H}", "-r", str(fps),
+            "-i", "-",
+            "-an",
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
+            "-pix_fmt", "yuv420p",
+            path,
+        ]
+        self.error: str | None = None
+        # Capture stderr in a file rather than a pipe nobody reads while
+        # frames are being written — a full pipe would stall FFmpeg.
+        self._log  = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                      stdout=subprocess.DEVNULL,
+                                      stderr=self._log)
+
+    def write(self, frame):
+        import numpy as np
+        if self.error is not None:
+            raise _EncodeError(self.error)
+        try:
+            # Frames are contiguous already; hand FFmpeg the buffer, not a copy.
+            self._proc.stdin.write(np.ascontiguousarray(frame).data)
+        except OSError:
+            self._finish()
+            if self.error is None:
+                self.error = "FFmpeg stopped accepting frames."
+            raise _EncodeError(self.error)
+
+    def release(self):
+        self._finish()
+
+    def _finish(self):
+        if self._log.closed:
+            return
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        rc = self._proc.wait()
+        if rc != 0 and self.error is None:
+            self._log.seek(0)
+            detail = self._log.read().decode("utf-8", errors="replace").strip()
+            self.error = (f"FFmpeg exited with status {rc}."
+                          + (f"\n{detail[-500:]}" if detail else ""))
+        self._log.close()
+
+
+def _encode_failed(parent, writer) -> bool:
+    """Warn and return True if a released writer reported an encoder failure."""
+    error = getattr(writer, "error", None)   # cv2.VideoWriter has none
+    if error is None:
+        return False
+    QMessageBox.warning(parent, "Export", f"Video encoding failed:\n{error}")
+    return True
+
+
+def _even(n: int) -> int:
+    """Round a frame dimension up to even — yuv420p (H.264, mp4v) needs it."""
+    return n + (n & 1)
+
+
+def _report_progress(progress: QProgressDialog, value: int, clock: QElapsedTimer):
+    """
+    Advance the export progress dialog and pump the event loop, but at most
+    every _PROGRESS_INTERVAL_MS (plus once for the final frame).  Each pump
+    repaints the modal dialog, which costs more than encoding a small frame.
+    """
+    if value < progress.maximum() and clock.elapsed() < _PROGRESS_INTERVAL_MS:
+        return
+    clock.restart()
+    progress.setValue(value)
+    QApplication.processEvents()
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_has_libx264(ffmpeg: str) -> bool:
+    """True if *ffmpeg* lists the libx264 encoder (LGPL builds often don't)."""
+    try:
+        out = subprocess.run([ffmpeg, "-hide_banner", "-encoders"],
+                             capture_output=True, timeout=10).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return b"libx264" in out
+
+
+def _open_writer(path: str, fps: float, W: int, H: int):
+    """
+    Open a writer for the no-audio render, preferring H.264.
+
+    Returns (writer, is_h264).  With FFmpeg available, frames are piped to it
+    directly.  Otherwise a cv2.VideoWriter is used: OpenCV builds without an
+    H.264 encoder fail to open 'avc1', so fall back to 'mp4v'.
+    """
+    import cv2
+    ffmpeg = _find_ffmpeg()
+    if ffmpeg and _ffmpeg_has_libx264(ffmpeg):
+        try:
+            return _FFmpegPipeWriter(ffmpeg, path, fps, W, H), True
+        except OSError:
+            pass
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'avc1'), fps, (W, H))
+    if writer.isOpened():
+        return writer, True
+    writer.release()
+    _safe_remove(path)
+    return cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), fps, (W, H)), False
+
+
 def _pixmap_to_bgr(pixmap, w: int, h: int):
     """
     Scale a QPixmap to (w × h) and return as a BGR numpy array.
@@ -263,11 +483,14 @@ def _pixmap_to_bgr(pixmap, w: int, h: int):
                         Qt.AspectRatioMode.IgnoreAspectRatio,
                         Qt.TransformationMode.SmoothTransformation
                         ).toImage()
-    img = img.convertToFormat(QImage.Format.Format_RGB888)
-    ptr = img.bits()
-    ptr.setsize(h * w * 3)
-    arr = np.frombuffer(ptr, dtype=np.uint8).reshape((h, w, 3)).copy()
-    return arr[:, :, ::-1]  # RGB → BGR
+    img = img.convertToFormat(QImage.Format.Format_BGR888)
+    # Rows are padded to 4 bytes, so view them through bytesPerLine and let
+    # the one copy (needed anyway — `img` dies here) drop the padding.
+    bpl = img.bytesPerLine()
+    ptr = img.constBits()
+    ptr.setsize(h * bpl)
+    rows = np.frombuffer(ptr, dtype=np.uint8).reshape((h, bpl))
+    return rows[:, :w * 3].reshape((h, w, 3)).copy()
 
 
 def _export_dual_video(parent, scene, left_item, left_player: VideoPlayer,
@@ -295,8 +518,8 @@ def _export_dual_video(parent, scene, left_item, left_player: VideoPlayer,
     # Use native video dimensions for full-resolution export.
     LW  = left_player.width  if left_has_video  else left_item.pixmap().width()
     LH  = left_player.height if left_has_video  else left_item.pixmap().height()
-    LW  = LW if LW % 2 == 0 else LW + 1
-    LH  = LH if LH % 2 == 0 else LH + 1
+    LW  = _even(LW)
+    LH  = _even(LH)
     fps = driver.playback_fps
 
     # Determine output dimensions for the right panel at native resolution
@@ -308,12 +531,10 @@ def _export_dual_video(parent, scene, left_item, left_player: VideoPlayer,
         RH_out = right_item.pixmap().height()
         # Scale right photo to match left panel height
         scale  = LH / RH_out if RH_out else 1.0
-        RW_out = max(1, int(RW_out * scale))
-        RW_out = RW_out if RW_out % 2 == 0 else RW_out + 1
+        RW_out = _even(max(1, int(RW_out * scale)))
     elif right_has_video:
         scale  = LH / RH_src if RH_src else 1.0
-        RW_out = max(1, int(RW_src * scale))
-        RW_out = RW_out if RW_out % 2 == 0 else RW_out + 1
+        RW_out = _even(max(1, int(RW_src * scale)))
     else:
         RW_out = LW  # fallback
 
@@ -333,19 +554,33 @@ def _export_dual_video(parent, scene, left_item, left_player: VideoPlayer,
 
     # Pre-render bubble overlay for the left panel once (bubbles are static).
     left_overlay = _prerender_bubble_overlay(scene, left_item, LW, LH)
+    if static_left_bgr is not None and not left_overlay.empty:
+        # A static left photo looks the same on every frame: blend it once.
+        static_left_bgr = _composite(static_left_bgr, left_overlay)
 
     progress = QProgressDialog("Exporting dual video…", "Cancel", 0, len(frames), parent)
     progress.setWindowTitle("Exporting")
     progress.setWindowModality(Qt.WindowModality.ApplicationModal)
     progress.setMinimumDuration(0)
     progress.setValue(0)
+    clock = QElapsedTimer()
+    clock.start()
 
     tmp_video = out_path + ".tmp_noaudio.mp4"
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    writer = cv2.VideoWriter(tmp_video, fourcc, fps, (W, H))
+    writer, is_h264 = _open_writer(tmp_video, fps, W, H)
 
     right_total = right_player.frame_count if right_has_video else 0
 
+    # Both panels render into slices of one reusable canvas.  Static sides
+    # are filled in once here; an empty right side simply stays black.
+    canvas     = np.zeros((H, W, 3), dtype=np.uint8)
+    left_view  = canvas[:, :LW]
+    right_view = canvas[:, LW:]
+    if static_left_bgr is not None:
+        left_view[:] = static_left_bgr
+    if static_right_bgr is not None:
+        right_view[:] = static_right_bgr
+
     cancelled = False
     try:
         for i, frame_idx in enumerate(frames):
@@ -357,38 +592,35 @@ def _export_dual_video(parent, scene, left_item, left_player: VideoPlayer,
             if left_has_video:
                 left_frame = left_player.get_frame_ndarray(frame_idx)
                 if left_frame is None:
-                    left_frame = np.zeros((LH, LW, 3), dtype=np.uint8)
-                if left_frame.shape[1] != LW or left_frame.shape[0] != LH:
-                    left_frame = cv2.resize(left_frame, (LW, LH))
-                left_rendered = _composite(left_frame, left_overlay)
-            else:
-                left_rendered = _composite(static_left_bgr.copy(), left_overlay)
+                    left_view[:] = 0
+                    _blend_in_place(left_view, left_overlay)
+                elif _fit_frame(left_frame, left_overlay, left_view) is left_frame:
+                    # Already the right size with nothing to blend.
+                    np.copyto(left_view, left_frame)
 
             # --- Right panel ---
             if right_has_video:
                 right_idx   = min(frame_idx, right_total - 1)
                 right_frame = right_player.get_frame_ndarray(right_idx)
                 if right_frame is None:
-                    right_frame = np.zeros((RH_src, RW_src, 3), dtype=np.uint8)
-                right_scaled = cv2.resize(right_frame, (RW_out, LH))
-            elif static_right_bgr is not None:
-                right_scaled = static_right_bgr
-            else:
-                right_scaled = np.zeros((LH, RW_out, 3), dtype=np.uint8)
-
-            writer.write(np.hstack([left_rendered, right_scaled]))
-            progress.setValue(i + 1)
-            QApplication.processEvents()
+                    right_view[:] = 0
+                else:
+                    cv2.resize(right_frame, (RW_out, LH), dst=right_view)
+
+            writer.write(canvas)
+            _report_progress(progress, i + 1, clock)
+    except _EncodeError:
+        pass    # reported below, once the writer has been released
     finally:
         writer.release()
         progress.close()
         scene.resume_decode_workers()
 
-    if cancelled:
+    if cancelled or _encode_failed(parent, writer):
         _safe_remove(tmp_video)
         return
 
-    _finish_video_audio(driver, tmp_video, out_path, frames)
+    _finish_video_audio(driver, tmp_video, out_path, frames, is_h264)
     _safe_remove(tmp_video)
 
     QMessageBox.information(parent, "Export", f"Dual video saved to:\n{out_path}")
@@ -399,19 +631,21 @@ def _export_dual_video(parent, scene, left_item, left_player: VideoPlayer,
 # ---------------------------------------------------------------------------
 
 def _finish_video_audio(player: VideoPlayer, rendered_video: str, out_path: str,
-                        export_frames: list[int]):
+                        export_frames: list[int], is_h264: bool = False):
     """Move or mux the rendered no-audio video according to the player audio setting."""
     if player.audio_muted:
         shutil.move(rendered_video, out_path)
         return
     _mux_audio(player.path, rendered_video, out_path, export_frames,
-               player.fps, player.speed_factor)
+               player.fps, player.speed_factor, is_h264)
 
 
 def _mux_audio(src_video: str, rendered_video: str, out_path: str,
-               export_frames: list[int], source_fps: float, speed_factor: float = 1.0):
+               export_frames: list[int], source_fps: float, speed_factor: float = 1.0,
+               is_h264: bool = False):
     """
     Attempt to mux audio from src_video into rendered_video → out_path.
+    An H.264 render is stream-copied; an mp4v one is re-encoded to H.264.
     Falls back to just renaming rendered_video if FFmpeg is unavailable or fails.
     """
     ffmpeg = _find_ffmpeg()
@@ -432,10 +666,12 @@ def _mux_audio(src_video: str, rendered_video: str, out_path: str,
         "-ss", str(start_time),
         "-i", src_video,
         "-map", "0:v:0",
-        "-c:v", "libx264",
-        "-preset", "veryfast",
-        "-crf", "18",
     ]
+    if is_h264:
+        # Already the final codec — only the audio needs encoding.
+        cmd += ["-c:v", "copy"]
+    else:
+        cmd += ["-c:v", "libx264", "-preset", "veryfast", "-crf", "18"]
     if speed_factor < 0.999:
         cmd += [
             "-filter_complex",
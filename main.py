@@ -130,7 +130,7 @@ def main():
 
         _logger.info("importing QApplication…")
         from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtGui import QIcon, QFont
+        from PyQt6.QtGui import QIcon, QFont, QPixmapCache
         from PyQt6.QtCore import QTimer
         _logger.info("QApplication imported OK")
 
@@ -139,6 +139,12 @@ def main():
         app.setOrganizationName("Long Weekend Labs")
         _logger.info("QApplication created OK")
 
+        # Rect/scrim bubble bodies are shared through QPixmapCache.  A typical
+        # body is ~0.2 MB (~0.8 MB at 2x DPR) and entries cap at 8 MB, so 24 MB
+        # keeps a few dozen bodies across zoom levels; Qt's 10 MB default
+        # would thrash on HiDPI screens.
+        QPixmapCache.setCacheLimit(24 * 1024)
+
         # Fast-fail before building the window if another instance is running
         if _check_duplicate_instance():
             _logger.info("duplicate instance detected — exiting")
@@ -25,7 +25,7 @@ from editor_controller import EditorController
 from version import __version__, __app_name__
 from constants import VIDEO_EXTENSIONS, ALL_EXTENSIONS
 from file_dialogs import open_file
-from about_dialog import AboutDialog
+from about_dialog import AboutDialog, preload_logo
 from shortcuts_dialog import ShortcutsDialog
 
 import export as exporter
@@ -38,9 +38,11 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"{__app_name__} v{__version__}")
         self.setMinimumSize(1180, 720)
         self.resize(1440, 900)
+        self._about_dialog = None   # built on first About click, then reused
         self._build_ui()
         self._connect_signals()
         QApplication.instance().installEventFilter(self)
+        preload_logo()
 
     # ------------------------------------------------------------------
     # UI construction
@@ -155,6 +157,7 @@ class MainWindow(QMainWindow):
         vc.cuts_cleared.connect(self._on_clear_cuts)
         vc.reverse_toggled.connect(self._on_reverse)
         vc.fullscreen_requested.connect(self._toggle_fullscreen)
+        vc.playback_toggled.connect(self.view.set_playback_mode)
 
         # Inspector dual settings
         self.props.dual_gap_changed.connect(self.scene.set_dual_gap)
@@ -609,7 +612,9 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
 
     def _on_about(self):
-        AboutDialog(self).exec()
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec()
 
     def _on_shortcuts(self):
         ShortcutsDialog(self).exec()
@@ -11,13 +11,14 @@ from PyQt6.QtWidgets import (
     QGraphicsSceneMouseEvent, QGraphicsSceneContextMenuEvent,
     QMenu, QApplication,
 )
-from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtCore import Qt, QRectF, QPointF, QTimer
 from PyQt6.QtGui import (
     QPixmap, QPainter, QPen, QBrush, QColor, QCursor,
 )
 
 HANDLE_SIZE = 10
 MIN_DISPLAY = 40.0
+PRESCALE_DELAY_MS = 150   # build the downscaled copy once zooming pauses this long
 
 
 # ---------------------------------------------------------------------------
@@ -172,6 +173,18 @@ class MediaItem(QGraphicsObject):
         self._flip_h = False
         self._flip_v = False
         self._video_player = None
+        # True for the scene's main/right video surface, whose pixmap the
+        # decoder replaces every frame (see set_video_frames).
+        self._video_frames = False
+        # Downsampled copy of _pixmap at the last painted device size:
+        # ((cacheKey, w, h, dpr), QPixmap).  _pixmap itself stays full resolution.
+        self._scaled_cache: tuple | None = None
+        # (key, w, h, dpr) the copy should be rebuilt for once zooming settles.
+        self._pending_scale: tuple | None = None
+        self._prescale_timer = QTimer(self)
+        self._prescale_timer.setSingleShot(True)
+        self._prescale_timer.setInterval(PRESCALE_DELAY_MS)
+        self._prescale_timer.timeout.connect(self._build_scaled_copy)
 
         # Drag-state
         self._resizing:       bool           = False   # True while handle active
@@ -187,6 +200,11 @@ class MediaItem(QGraphicsObject):
             self.setZValue(1)
         else:
             self.setZValue(-1)
+        # Still media is kept as a device-resolution pixmap so pans and
+        # bubble edits blit it instead of re-rendering; video items switch to
+        # NoCache (see _update_cache_mode) since every frame would invalidate
+        # it anyway.
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         self._handles = {
             c: MediaResizeHandle(c, self) for c in ("TL", "TR", "BL", "BR")
@@ -214,11 +232,32 @@ class MediaItem(QGraphicsObject):
 
     def set_pixmap(self, pixmap: QPixmap):
         """Replace pixmap (next video frame). Display size unchanged."""
+        if pixmap.cacheKey() == self._pixmap.cacheKey():
+            return  # same frame already shown (cache hit / paused scrub)
         self._pixmap = pixmap
+        self._scaled_cache = None
         self.update()
 
     def set_video_player(self, player):
         self._video_player = player
+        self._update_cache_mode()
+
+    def set_video_frames(self, on: bool):
+        """
+        Mark this item as a video surface fed by the scene's decoder (the
+        main and right video items, which own no player themselves).
+        """
+        self._video_frames = bool(on)
+        self._scaled_cache = None
+        self._update_cache_mode()
+
+    def _plays_video(self) -> bool:
+        """True if the pixmap is replaced every frame (own player or scene decoder)."""
+        return self._video_frames or self._video_player is not None
+
+    def _update_cache_mode(self):
+        self.setCacheMode(QGraphicsItem.CacheMode.NoCache if self._plays_video()
+                          else QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
     def video_player(self):
         return self._video_player
@@ -258,7 +297,17 @@ class MediaItem(QGraphicsObject):
         return QRectF(0, 0, self._display_w, self._display_h)
 
     def paint(self, painter: QPainter, option, widget=None):
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        # deviceTransform includes the devicePixelRatio, so on HiDPI screens
+        # the copy is sized in physical pixels, not logical ones.
+        t   = painter.deviceTransform()
+        src = self._device_pixmap(t, painter.device().devicePixelRatioF())
+        # A pre-scaled copy that already lands 1:1 on the device needs no
+        # filtering; anything else is resampled smoothly.
+        one_to_one = (not t.isRotating()
+                      and abs(abs(t.m11()) * self._display_w - src.width()) < 0.5
+                      and abs(abs(t.m22()) * self._display_h - src.height()) < 0.5)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform,
+                              not one_to_one)
         painter.save()
         if self._flip_h or self._flip_v:
             painter.translate(self._display_w if self._flip_h else 0,
@@ -267,8 +316,8 @@ class MediaItem(QGraphicsObject):
                           -1 if self._flip_v else 1)
         painter.drawPixmap(
             QRectF(0, 0, self._display_w, self._display_h),
-            self._pixmap,
-            QRectF(self._pixmap.rect()),
+            src,
+            QRectF(src.rect()),
         )
         painter.restore()
         if self.isSelected():
@@ -277,6 +326,50 @@ class MediaItem(QGraphicsObject):
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRect(QRectF(1, 1, self._display_w - 2, self._display_h - 2))
 
+    def _device_pixmap(self, t, dpr: float = 1.0) -> QPixmap:
+        """
+        Return the pixmap to blit under device transform *t*.
+
+        When the media is shown smaller than its source (e.g. a 4000×3000
+        photo at 800×600 device pixels), a smooth-scaled copy at the device
+        size is reused, so repaints don't resample the full-resolution pixmap
+        every time.  The copy is only built once the size has held still for
+        PRESCALE_DELAY_MS — while zooming, each step draws the source directly
+        rather than paying for a full smooth rescale.
+
+        Upscaled or rotated media use the source as-is, and so does anything
+        playing video (overlays with their own player, and the main/right
+        items marked by set_video_frames): every frame is a new pixmap, so
+        the copy would never be reused.
+        """
+        pm = self._pixmap
+        if t.isRotating() or pm.isNull() or self._plays_video():
+            return pm
+        w = round(self._display_w * abs(t.m11()))
+        h = round(self._display_h * abs(t.m22()))
+        if not (0 < w < pm.width() and 0 < h < pm.height()):
+            return pm
+        key = (pm.cacheKey(), w, h, dpr)
+        if self._scaled_cache is not None and self._scaled_cache[0] == key:
+            return self._scaled_cache[1]
+        self._pending_scale = (key, w, h, dpr)
+        self._prescale_timer.start()   # restarts while zoom keeps changing
+        return pm
+
+    def _build_scaled_copy(self):
+        """Build the copy requested by _device_pixmap and repaint with it."""
+        pending, self._pending_scale = self._pending_scale, None
+        if pending is None:
+            return
+        key, w, h, dpr = pending
+        if key[0] != self._pixmap.cacheKey() or self._plays_video():
+            return   # pixmap replaced in the meantime
+        scaled = self._pixmap.scaled(w, h, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                     Qt.TransformationMode.SmoothTransformation)
+        scaled.setDevicePixelRatio(dpr)
+        self._scaled_cache = (key, scaled)
+        self.update()
+
     def itemChange(self, change, value):
         if change == QGraphicsItem.GraphicsItemChange.ItemSelectedHasChanged:
             for h in self._handles.values():
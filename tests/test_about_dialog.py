@@ -0,0 +1,43 @@
+"""
+The About dialog builds its widgets lazily; the first open must still be
+centred on the parent like every later one.
+
+Run with:  python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+_app = QApplication.instance() or QApplication([])
+
+from about_dialog import AboutDialog  # noqa: E402
+
+
+class AboutDialogPlacementTest(unittest.TestCase):
+
+    def test_first_open_is_centred_on_parent(self):
+        parent = QWidget()
+        parent.setGeometry(100, 100, 900, 550)
+        parent.show()
+        _app.processEvents()
+        dialog = AboutDialog(parent)
+        centres = []
+        for _ in range(2):
+            dialog.show()
+            _app.processEvents()
+            centres.append(dialog.frameGeometry().center().y())
+            dialog.hide()
+        parent_cy = parent.frameGeometry().center().y()
+        self.assertLessEqual(abs(centres[0] - parent_cy), 2)
+        self.assertEqual(centres[0], centres[1])
+        parent.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
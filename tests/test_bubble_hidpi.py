@@ -0,0 +1,108 @@
+"""
+Rect and scrim bubbles blit their body from QPixmapCache; on a HiDPI paint
+device, and inside a framed QGraphicsView (widget redirection offset), the
+cached blit must match drawing the path directly.
+
+Run with:  python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from PyQt6.QtCore import QRectF  # noqa: E402
+from PyQt6.QtGui import QImage, QPainter, QPixmapCache  # noqa: E402
+from PyQt6.QtWidgets import (  # noqa: E402
+    QApplication, QGraphicsItem, QGraphicsScene, QGraphicsView,
+)
+
+_app = QApplication.instance() or QApplication([])
+
+import bubble  # noqa: E402
+from bubble import BubbleItem  # noqa: E402
+
+
+def _render(style: str, dpr: float) -> np.ndarray:
+    """Paint one bubble into a (400 × 300 logical) image at *dpr*."""
+    QPixmapCache.clear()
+    scene = QGraphicsScene(0, 0, 400, 300)
+    item = BubbleItem(200, 130, style=style)
+    scene.addItem(item)
+    item.set_text("Hello")
+    item.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+    img = QImage(round(400 * dpr), round(300 * dpr),
+                 QImage.Format.Format_ARGB32_Premultiplied)
+    img.setDevicePixelRatio(dpr)
+    img.fill(0xFFFFFFFF)
+    painter = QPainter(img)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    scene.render(painter, QRectF(0, 0, 400, 300), QRectF(0, 0, 400, 300))
+    painter.end()
+    return _to_array(img)
+
+
+def _to_array(img: QImage) -> np.ndarray:
+    ptr = img.constBits()
+    ptr.setsize(img.sizeInBytes())
+    rows = np.frombuffer(ptr, dtype=np.uint8).reshape((img.height(), img.bytesPerLine()))
+    return rows[:, :img.width() * 4].astype(np.int16)
+
+
+def _grab_view(style: str) -> np.ndarray:
+    """Paint one uncached bubble through a real, framed QGraphicsView."""
+    QPixmapCache.clear()
+    scene = QGraphicsScene(0, 0, 400, 300)
+    item = BubbleItem(200, 130, style=style)
+    scene.addItem(item)
+    item.set_text("Hello")
+    item.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+    view = QGraphicsView(scene)
+    view.resize(440, 340)
+    view.show()
+    _app.processEvents()
+    try:
+        return _to_array(view.grab().toImage())
+    finally:
+        view.close()
+
+
+class CachedFillHiDpiTest(unittest.TestCase):
+
+    def _assert_matches_direct(self, style: str, dpr: float):
+        cached = _render(style, dpr)
+        with mock.patch.object(bubble, "_PIXMAP_CACHE_MAX_PX", 0):
+            direct = _render(style, dpr)     # too big to cache → drawPath
+        self.assertLessEqual(int(np.abs(cached - direct).max()), 2,
+                             f"{style} at DPR {dpr}")
+
+    def test_rect_at_dpr_2(self):
+        self._assert_matches_direct("rect", 2.0)
+
+    def test_scrim_at_dpr_2(self):
+        self._assert_matches_direct("scrim", 2.0)
+
+    def test_rect_at_dpr_1(self):
+        self._assert_matches_direct("rect", 1.0)
+
+    def _assert_view_matches_direct(self, style: str):
+        self.assertGreater(QGraphicsView().frameWidth(), 0)
+        cached = _grab_view(style)
+        with mock.patch.object(bubble, "_PIXMAP_CACHE_MAX_PX", 0):
+            direct = _grab_view(style)
+        self.assertLessEqual(int(np.abs(cached - direct).max()), 2,
+                             f"{style} in a framed view")
+
+    def test_rect_in_framed_view(self):
+        self._assert_view_matches_direct("rect")
+
+    def test_scrim_in_framed_view(self):
+        self._assert_view_matches_direct("scrim")
+
+
+if __name__ == "__main__":
+    unittest.main()
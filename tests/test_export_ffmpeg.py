@@ -0,0 +1,112 @@
+"""
+Export must survive an FFmpeg child that dies: the failure is reported to the
+user and no partial file is left behind or treated as a finished H.264 render.
+
+Run with:  python -m unittest discover -s tests
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+import export  # noqa: E402
+
+_app = QApplication.instance() or QApplication([])
+
+# Lists libx264 when probed, then fails the way an encoder-less build does.
+_EXIT_AT_ONCE = """\
+    #!/bin/sh
+    case "$*" in *-encoders*) echo " V....D libx264"; exit 0;; esac
+    echo "Unknown encoder 'libx264'" >&2
+    exit 1
+"""
+# Accepts every frame, then fails at the end of the stream.
+_EXIT_AFTER_INPUT = """\
+    #!/bin/sh
+    case "$*" in *-encoders*) echo " V....D libx264"; exit 0;; esac
+    cat > /dev/null
+    echo "muxing failed" >&2
+    exit 1
+"""
+
+
+class FailingFFmpegTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+        export._ffmpeg_has_libx264.cache_clear()
+
+    def tearDown(self):
+        export._ffmpeg_has_libx264.cache_clear()
+        self._tmp.cleanup()
+
+    def _fake_ffmpeg(self, script: str) -> str:
+        path = os.path.join(self.dir, "ffmpeg")
+        with open(path, "w") as f:
+            f.write(textwrap.dedent(script))
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        return path
+
+    def _make_video(self, frames: int = 6) -> str:
+        import cv2
+        path = os.path.join(self.dir, "src.avi")
+        w = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 25, (64, 48))
+        for i in range(frames):
+            w.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+        w.release()
+        return path
+
+    def test_write_raises_encode_error_when_ffmpeg_exits(self):
+        ffmpeg = self._fake_ffmpeg(_EXIT_AT_ONCE)
+        out = os.path.join(self.dir, "out.mp4")
+        writer = export._FFmpegPipeWriter(ffmpeg, out, 25, 640, 480)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        with self.assertRaises(export._EncodeError):
+            for _ in range(200):        # more than any pipe buffer holds
+                writer.write(frame)
+        writer.release()
+        self.assertIn("status 1", writer.error)
+        self.assertIn("Unknown encoder", writer.error)
+
+    def test_release_records_nonzero_exit(self):
+        ffmpeg = self._fake_ffmpeg(_EXIT_AFTER_INPUT)
+        writer = export._FFmpegPipeWriter(ffmpeg, os.path.join(self.dir, "o.mp4"),
+                                          25, 64, 48)
+        writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+        writer.release()
+        self.assertIn("muxing failed", writer.error)
+
+    def test_single_video_export_reports_failure(self):
+        from canvas import PhotoScene
+        ffmpeg = self._fake_ffmpeg(_EXIT_AT_ONCE)
+        scene = PhotoScene()
+        self.assertTrue(scene.load_video(self._make_video()))
+        out = os.path.join(self.dir, "export.mp4")
+        try:
+            with mock.patch.object(export, "_find_ffmpeg", return_value=ffmpeg), \
+                 mock.patch.object(export.QMessageBox, "warning") as warning, \
+                 mock.patch.object(export.QMessageBox, "information") as info:
+                export._export_single_video(None, scene, scene._photo_item,
+                                            scene._video_player, out)
+        finally:
+            scene.reset_project()
+        warning.assert_called_once()
+        self.assertIn("encoding failed", warning.call_args.args[2])
+        info.assert_not_called()
+        self.assertFalse(os.path.exists(out))
+        self.assertFalse(os.path.exists(out + ".tmp_noaudio.mp4"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+MediaItem's pre-scaled copy must be built at the device (physical) pixel size,
+so HiDPI screens keep full detail; it is only built once zooming settles, and
+never for video.
+
+Run with:  python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from PyQt6.QtCore import QRectF  # noqa: E402
+from PyQt6.QtGui import QImage, QPainter, QPixmap  # noqa: E402
+from PyQt6.QtWidgets import QApplication, QGraphicsItem, QGraphicsScene  # noqa: E402
+
+_app = QApplication.instance() or QApplication([])
+
+from media_item import MediaItem  # noqa: E402
+
+
+def _checkerboard(w: int, h: int) -> QPixmap:
+    arr = np.where((np.indices((h, w)).sum(axis=0) % 2) == 0, 255, 0).astype(np.uint8)
+    img = QImage(arr.tobytes(), w, h, w, QImage.Format.Format_Grayscale8)
+    return QPixmap.fromImage(img.copy())
+
+
+def _render(item: MediaItem, w: float, h: float, dpr: float) -> np.ndarray:
+    scene = QGraphicsScene(0, 0, w, h)
+    scene.addItem(item)
+    img = QImage(round(w * dpr), round(h * dpr), QImage.Format.Format_RGB32)
+    img.setDevicePixelRatio(dpr)
+    img.fill(0xFF808080)
+    painter = QPainter(img)
+    scene.render(painter, QRectF(0, 0, w, h), QRectF(0, 0, w, h))
+    painter.end()
+    scene.removeItem(item)
+    ptr = img.constBits()
+    ptr.setsize(img.sizeInBytes())
+    rows = np.frombuffer(ptr, dtype=np.uint8).reshape((img.height(), img.bytesPerLine()))
+    return rows[:, :img.width() * 4].astype(np.int16)
+
+
+def _settle(item: MediaItem):
+    """Let the pre-scale debounce timer fire."""
+    deadline = time.monotonic() + 2.0
+    while item._prescale_timer.isActive() and time.monotonic() < deadline:
+        _app.processEvents()
+        time.sleep(0.01)
+
+
+def _item(pixmap: QPixmap, w: float, h: float) -> MediaItem:
+    item = MediaItem(pixmap)
+    item.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+    item.set_display_size(w, h)
+    return item
+
+
+class MediaItemHiDpiTest(unittest.TestCase):
+
+    def test_half_size_at_dpr_2_keeps_full_detail(self):
+        # 400×300 source shown at 200×150 logical = 400×300 device pixels.
+        pm = _checkerboard(400, 300)
+        item = _item(pm, 200, 150)
+        _render(item, 200, 150, 2.0)
+        _settle(item)
+        cached = _render(item, 200, 150, 2.0)
+        with mock.patch.object(MediaItem, "_device_pixmap",
+                               lambda self, t, dpr=1.0: self._pixmap):
+            direct = _render(_item(pm, 200, 150), 200, 150, 2.0)
+        self.assertEqual(int(np.abs(cached - direct).max()), 0)
+
+    def test_scaled_copy_uses_physical_size(self):
+        item = _item(_checkerboard(800, 600), 100, 75)
+        _render(item, 100, 75, 2.0)
+        _settle(item)
+        scaled = item._scaled_cache[1]
+        self.assertEqual((scaled.width(), scaled.height()), (200, 150))
+        self.assertEqual(scaled.devicePixelRatio(), 2.0)
+
+    def test_zoom_steps_draw_the_source_until_settled(self):
+        item = _item(_checkerboard(800, 600), 100, 75)
+        _render(item, 100, 75, 1.0)
+        self.assertIsNone(item._scaled_cache)
+        self.assertTrue(item._prescale_timer.isActive())
+        _settle(item)
+        self.assertIsNotNone(item._scaled_cache)
+
+    def test_scene_video_item_skips_the_scaled_copy(self):
+        import cv2
+        from canvas import PhotoScene
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "clip.avi")
+            writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"),
+                                     25, (320, 240))
+            for i in range(3):
+                writer.write(np.full((240, 320, 3), i * 60, dtype=np.uint8))
+            writer.release()
+            scene = PhotoScene()
+            try:
+                self.assertTrue(scene.load_video(path))
+                item = scene._photo_item
+                self.assertEqual(item.cacheMode(), QGraphicsItem.CacheMode.NoCache)
+                img = QImage(80, 60, QImage.Format.Format_RGB32)
+                painter = QPainter(img)
+                scene.render(painter, QRectF(0, 0, 80, 60), item.sceneBoundingRect())
+                painter.end()
+                _settle(item)
+                self.assertIsNone(item._scaled_cache)
+                self.assertIsNone(item._pending_scale)
+            finally:
+                scene.reset_project()
+
+    def test_video_items_skip_the_scaled_copy(self):
+        item = _item(_checkerboard(800, 600), 100, 75)
+        item.set_video_player(object())
+        item.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+        _render(item, 100, 75, 1.0)
+        self.assertIsNone(item._scaled_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -196,6 +196,7 @@ class VideoControls(QWidget):
     speed_changed       = pyqtSignal(int)
     audio_muted_changed = pyqtSignal(bool)
     fullscreen_requested = pyqtSignal()
+    playback_toggled    = pyqtSignal(bool)   # True while the play timer runs
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -468,12 +469,16 @@ class VideoControls(QWidget):
             self._timer.start(ms)
         else:
             self._timer.stop()
+        self.playback_toggled.emit(self._playing)
 
     def _stop_playback(self):
+        was_playing   = self._playing
         self._playing = False
         self._timer.stop()
         self._btn_play.setIcon(self._icon_play)
         self._btn_play.setToolTip("Play  (Space)")
+        if was_playing:
+            self.playback_toggled.emit(False)
 
     def _advance_frame(self):
         active = self._active_player
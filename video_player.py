@@ -23,6 +23,12 @@ from constants import VIDEO_EXTENSIONS
 
 # Memory budget for the frame cache across all sizes of video
 _CACHE_BUDGET_MB = 256
+# Memory budget for converted preview pixmaps (per player)
+_PIXMAP_CACHE_BUDGET_MB = 128
+# Frames decoded ahead of the latest request while the worker is idle
+_PREFETCH_FRAMES = 4
+# Forward gaps up to this many frames are skipped with grab() instead of a seek
+_GRAB_SKIP_MAX = 12
 
 
 class FrameCache:
@@ -41,9 +47,10 @@ class FrameCache:
     """
 
     _MAX_FRAMES = 128   # hard cap to avoid extreme caching on tiny resolutions
+    _BUDGET_MB  = _CACHE_BUDGET_MB
 
     def __init__(self):
-        self._budget: int = _CACHE_BUDGET_MB * 1024 * 1024
+        self._budget: int = self._BUDGET_MB * 1024 * 1024
         self._store: OrderedDict[int, object] = OrderedDict()
         self._bytes_used: int = 0
 
@@ -59,19 +66,39 @@ class FrameCache:
         if idx in self._store:
             self._store.move_to_end(idx)
             return
-        fb = frame.nbytes  # actual bytes for this numpy array
+        fb = self._nbytes(frame)
         self._store[idx] = frame
         self._bytes_used += fb
         # Evict LRU entries until within budget and under the hard frame cap.
         while (self._bytes_used > self._budget
                or len(self._store) > self._MAX_FRAMES) and len(self._store) > 1:
             _, evicted = self._store.popitem(last=False)
-            self._bytes_used -= evicted.nbytes
+            self._bytes_used -= self._nbytes(evicted)
 
     def clear(self):
         self._store.clear()
         self._bytes_used = 0
 
+    @staticmethod
+    def _nbytes(frame) -> int:
+        return frame.nbytes  # actual bytes for this numpy array
+
+
+class PixmapFrameCache(FrameCache):
+    """
+    LRU cache for frames already converted to QPixmap (UI thread only).
+
+    Sits in front of FrameCache so that scrubbing back and forth over recently
+    shown frames skips the BGR → RGB → QPixmap conversion as well as the decode.
+    """
+
+    _MAX_FRAMES = 32
+    _BUDGET_MB  = _PIXMAP_CACHE_BUDGET_MB
+
+    @staticmethod
+    def _nbytes(pixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
 
 class FrameDecodeWorker(QObject):
     """
@@ -94,6 +121,12 @@ class FrameDecodeWorker(QObject):
         • pause() / resume() allow the export code (which runs on the UI thread
           and accesses the player directly) to safely serialize with decode.
 
+    Prefetch:
+        Once the latest request has been emitted and nothing newer is queued,
+        the next _PREFETCH_FRAMES frames are decoded into the player's
+        FrameCache.  Those reads are sequential, so they skip the seek, and
+        the loop stops as soon as a new request arrives or pause() is called.
+
     Stale-frame filtering:
         A generation counter (incremented via new_generation()) is stamped on
         each request and result.  Results from a superseded generation are
@@ -184,6 +217,24 @@ class FrameDecodeWorker(QObject):
         image = QImage(frame_rgb.tobytes(), w, h, ch * w,
                        QImage.Format.Format_RGB888).copy()  # .copy() detaches from buffer
         self.frame_ready.emit(gen, idx, image)
+        self._prefetch(idx)
+
+    def _prefetch(self, idx: int):
+        """Warm the frame cache with the frames following *idx* while idle."""
+        last = self._player.frame_count - 1
+        for nxt in range(idx + 1, min(idx + _PREFETCH_FRAMES, last) + 1):
+            with self._lock:
+                if self._paused or self._in_flight > 0:
+                    return
+                self._idle.clear()      # keep pause() waiting until this read ends
+            try:
+                frame = self._player._read_frame(nxt)
+            finally:
+                with self._lock:
+                    if self._in_flight == 0:
+                        self._idle.set()
+            if frame is None:
+                return
 
 
 class VideoPlayer:
@@ -211,6 +262,7 @@ class VideoPlayer:
         self._audio_muted = False
         self._last_read   = -1   # track last frame read for sequential optimisation
         self._cache: FrameCache | None = None
+        self._pixmaps: PixmapFrameCache | None = None
 
     # ------------------------------------------------------------------
     # Load / release
@@ -244,6 +296,7 @@ class VideoPlayer:
         self._audio_muted = False
         self._last_read   = -1
         self._cache       = FrameCache()
+        self._pixmaps     = PixmapFrameCache()
         return True
 
     def release(self):
@@ -255,6 +308,9 @@ class VideoPlayer:
         if self._cache is not None:
             self._cache.clear()
             self._cache = None
+        if self._pixmaps is not None:
+            self._pixmaps.clear()
+            self._pixmaps = None
 
     def is_loaded(self) -> bool:
         return self._cap is not None
@@ -265,10 +321,26 @@ class VideoPlayer:
 
     def get_frame_pixmap(self, frame_idx: int) -> QPixmap | None:
         """Return frame_idx as a QPixmap (RGB), or None on error."""
+        cached = self.cached_frame_pixmap(frame_idx)
+        if cached is not None:
+            return cached
         frame = self._read_frame(frame_idx)
         if frame is None:
             return None
-        return self._bgr_to_pixmap(frame)
+        pixmap = self._bgr_to_pixmap(frame)
+        self.store_frame_pixmap(frame_idx, pixmap)
+        return pixmap
+
+    def cached_frame_pixmap(self, frame_idx: int) -> QPixmap | None:
+        """Return frame_idx from the pixmap cache without decoding, or None."""
+        if self._pixmaps is None:
+            return None
+        return self._pixmaps.get(max(0, min(frame_idx, self._frame_count - 1)))
+
+    def store_frame_pixmap(self, frame_idx: int, pixmap: QPixmap):
+        """Remember a converted frame (e.g. one built from a worker QImage)."""
+        if self._pixmaps is not None and not pixmap.isNull():
+            self._pixmaps.put(max(0, min(frame_idx, self._frame_count - 1)), pixmap)
 
     def get_frame_ndarray(self, frame_idx: int) -> object | None:
         """Return frame_idx as a BGR numpy array, or None on error."""
@@ -287,9 +359,15 @@ class VideoPlayer:
                 return cached
 
         # Cache miss — decode from disk
-        # Skip the expensive seek when reading the next sequential frame
-        if frame_idx != self._last_read + 1:
-            self._cap.set(cv2.CAP_PROP_POS_FRAMES, float(frame_idx))
+        # Skip the expensive seek when reading the next sequential frame.
+        # A short hop forward (e.g. over a small cut) is cheaper to grab()
+        # through — no colour conversion — than a seek, which re-decodes
+        # from the previous keyframe.
+        gap = frame_idx - self._last_read - 1
+        if gap != 0:
+            if not (self._last_read >= 0 and 0 < gap <= _GRAB_SKIP_MAX
+                    and all(self._cap.grab() for _ in range(gap))):
+                self._cap.set(cv2.CAP_PROP_POS_FRAMES, float(frame_idx))
         ret, frame = self._cap.read()
         self._last_read = frame_idx if ret else -1
 
@@ -414,11 +492,11 @@ class VideoPlayer:
     @staticmethod
     def qimage_to_bgr(img: QImage) -> object:
         """Convert a QImage to a BGR numpy array for OpenCV."""
-        import cv2
         import numpy as np
-        img = img.convertToFormat(QImage.Format.Format_RGB888)
+        img = img.convertToFormat(QImage.Format.Format_BGR888)
         w, h = img.width(), img.height()
-        ptr  = img.bits()
-        ptr.setsize(h * w * 3)
-        arr = np.frombuffer(ptr, dtype=np.uint8).reshape((h, w, 3)).copy()
-        return cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+        bpl  = img.bytesPerLine()    # rows are 4-byte aligned
+        ptr  = img.constBits()
+        ptr.setsize(h * bpl)
+        rows = np.frombuffer(ptr, dtype=np.uint8).reshape((h, bpl))
+        return rows[:, :w * 3].reshape((h, w, 3)).copy()